@@ -0,0 +1,34 @@
+"""Helpers for traversing parsed Python modules."""
+
+import ast
+from collections import deque
+from typing import Iterator
+
+# Fields that hold nested statement blocks, in the order they appear in node._fields
+# (ExceptHandler and match_case nodes are reached through "handlers" and "cases" and
+# carry their own "body")
+_BLOCK_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+def walk_statements(tree: ast.Module) -> Iterator[ast.AST]:
+    """
+    Yield every statement in a module, including those in nested blocks.
+
+    Imports, definitions and assignments are statements, so expression subtrees -
+    the bulk of any AST - are never visited. Statements are yielded in the same
+    breadth-first order as ast.walk.
+
+    Args:
+        tree: Parsed module
+
+    Yields:
+        Statement nodes (plus the ExceptHandler/match_case nodes that contain them)
+    """
+    todo = deque(tree.body)
+    while todo:
+        node = todo.popleft()
+        for field in _BLOCK_FIELDS:
+            block = getattr(node, field, None)
+            if isinstance(block, list):
+                todo.extend(block)
+        yield node
@@ -0,0 +1,105 @@
+"""On-disk cache of per-file import scan results."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pre_commit_tools.check_exports import __version__
+
+CACHE_DIR_NAME = ".check-exports-cache"
+
+# Bump when the cached data layout or the import detection logic changes
+CACHE_FORMAT = 3
+
+# (st_mtime_ns, st_size) of a file when it was scanned
+FileStamp = Tuple[int, int]
+
+# Imports found in a file, as (import key, line number) pairs
+FileImports = List[Tuple[str, int]]
+
+
+def get_cache_file(codebase_root: Path, lib_names: Iterable[str]) -> Path:
+    """
+    Get path to the import cache file for a set of libraries scanned together.
+
+    The file is named after a digest of the library names, so its name stays short
+    however many libraries share the scan.
+
+    Args:
+        codebase_root: Directory that is scanned for imports
+        lib_names: Names of the libraries the scan looks for
+
+    Returns:
+        Path to the cache file
+    """
+    digest = hashlib.sha1("+".join(sorted(lib_names)).encode()).hexdigest()[:16]
+    return codebase_root / CACHE_DIR_NAME / f"imports-{digest}.json"
+
+
+def load_import_cache(cache_file: Path) -> Dict[str, Tuple[FileStamp, FileImports]]:
+    """
+    Load cached scan results.
+
+    Args:
+        cache_file: Path to cache file
+
+    Returns:
+        Dict mapping file path to (stamp, imports); empty if the cache is missing,
+        unreadable or was written by a different version
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        # OSError: missing file or file reading issues
+        # ValueError: corrupt JSON
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != [__version__, CACHE_FORMAT]:
+        return {}
+
+    entries = {}
+    try:
+        for file_path, (stamp, found) in data["files"].items():
+            entries[file_path] = ((stamp[0], stamp[1]), [(key, lineno) for key, lineno in found])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        # Unexpected structure
+        return {}
+    return entries
+
+
+def save_import_cache(cache_file: Path, entries: Dict[str, Tuple[FileStamp, FileImports]]) -> None:
+    """
+    Write scan results to the cache, replacing it atomically.
+
+    Failures are ignored: the cache is an optimization, so a read-only checkout
+    just means every run scans from scratch.
+
+    Args:
+        cache_file: Path to cache file
+        entries: Dict mapping file path to (stamp, imports)
+    """
+    data = {"version": [__version__, CACHE_FORMAT], "files": entries}
+    cache_dir = cache_file.parent
+    tmp_path: Optional[str] = None
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        # Keep the cache out of version control, like .pytest_cache does
+        gitignore = cache_dir / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("# Created by check-exports\n*\n")
+
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        # Unwritable directory or disk issues
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
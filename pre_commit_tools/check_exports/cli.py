@@ -4,12 +4,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from pre_commit_tools.check_exports.validator import validate_libraries
-from pre_commit_tools.check_exports.reporter import (
-    report_violations,
-    report_success,
-    report_summary,
-)
 from pre_commit_tools.check_exports.config import Config
 
 
@@ -28,6 +22,7 @@ ENVIRONMENT VARIABLES:
   CHECK_EXPORTS_EXCLUDE         Comma-separated exclude patterns
   CHECK_EXPORTS_MAX_VIOLATIONS  Maximum violations threshold
   CHECK_EXPORTS_PUBLIC_SUBMODULES Comma-separated public submodules
+  CHECK_EXPORTS_NO_CACHE        Set to 'true' to skip the scan cache
 
 CONFIG FILE FORMAT (.check-exports.toml):
   [tool.check-exports]
@@ -39,6 +34,7 @@ CONFIG FILE FORMAT (.check-exports.toml):
   exclude = ["tests/*", "build/*"]
   max_violations = 10
   public_submodules = ["utils", "network"]
+  no_cache = false
 
 EXAMPLES:
   check-exports ./mylib
@@ -50,6 +46,7 @@ EXAMPLES:
   check-exports --max-violations 5 ./lib
   check-exports --config ./config.toml
   check-exports --public-submodules "utils,network" ./lib
+  check-exports --no-cache ./lib
   CHECK_EXPORTS_LIBS="./lib1,./lib2" check-exports
         """,
     )
@@ -98,6 +95,11 @@ EXAMPLES:
         "--public-submodules",
         help="Comma-separated list of submodules allowed to be imported directly",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the .check-exports-cache scan cache (for read-only checkouts/CI)",
+    )
 
     return parser
 
@@ -132,6 +134,7 @@ def main() -> int:
 
         max_violations = parsed_args.max_violations or env_config.max_violations
         public_submodules = _parse_list(parsed_args.public_submodules) or env_config.public_submodules
+        no_cache = parsed_args.no_cache or env_config.no_cache
     elif file_config:
         lib_paths = lib_paths or file_config.libraries
         json_format = parsed_args.json or file_config.json_format
@@ -141,6 +144,7 @@ def main() -> int:
         exclude_patterns = _parse_exclude_patterns(parsed_args.exclude, file_config.exclude_patterns)
         max_violations = parsed_args.max_violations or file_config.max_violations
         public_submodules = _parse_list(parsed_args.public_submodules) or file_config.public_submodules
+        no_cache = parsed_args.no_cache or file_config.no_cache
     else:
         json_format = parsed_args.json
         quiet = parsed_args.quiet
@@ -149,13 +153,24 @@ def main() -> int:
         exclude_patterns = _parse_exclude_patterns(parsed_args.exclude)
         max_violations = parsed_args.max_violations
         public_submodules = _parse_list(parsed_args.public_submodules)
+        no_cache = parsed_args.no_cache
 
     if not lib_paths:
         parser.print_help()
         return 1
 
+    # Imported here so --help and usage errors do not pay for the validation machinery
+    from pre_commit_tools.check_exports.reporter import (
+        report_success,
+        report_summary,
+        report_violations,
+    )
+    from pre_commit_tools.check_exports.validator import validate_libraries
+
     # Validate all libraries
-    violations, stats = validate_libraries(lib_paths, exclude_patterns, public_submodules, verbose)
+    violations, stats = validate_libraries(
+        lib_paths, exclude_patterns, public_submodules, verbose, use_cache=not no_cache
+    )
 
     # Filter out warnings from exit code determination
     error_violations = [v for v in violations if not v.is_warning]
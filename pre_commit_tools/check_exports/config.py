@@ -5,11 +5,6 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib  # type: ignore
-
 
 class Config:
     """Represents check-exports configuration.
@@ -23,6 +18,7 @@ class Config:
         quiet: Whether to suppress success message
         no_color: Whether to disable colored output
         verbose: Whether to show detailed statistics
+        no_cache: Whether to skip the on-disk scan cache
 
 
         max_violations: Maximum allowed violations before failing
@@ -39,6 +35,7 @@ class Config:
         exclude_patterns: Optional[List[str]] = None,
         max_violations: Optional[int] = None,
         public_submodules: Optional[List[str]] = None,
+        no_cache: bool = False,
     ) -> None:
         """Initialize configuration object.
 
@@ -52,6 +49,7 @@ class Config:
 
             max_violations: Max violations threshold (default: None)
             public_submodules: Public submodules list (default: [])
+            no_cache: Skip reading and writing .check-exports-cache if True (default: False)
         """
         self.libraries = libraries
         self.json_format = json_format
@@ -61,6 +59,7 @@ class Config:
         self.exclude_patterns = exclude_patterns or []
         self.max_violations = max_violations
         self.public_submodules = public_submodules or []
+        self.no_cache = no_cache
 
     @staticmethod
     def load_from_file(config_path: Optional[Path] = None) -> Optional["Config"]:
@@ -79,6 +78,12 @@ class Config:
         if not config_path.exists():
             return None
 
+        # Only needed when a config file exists, so keep it off the startup path
+        try:
+            import tomllib
+        except ImportError:
+            import tomli as tomllib  # type: ignore
+
         try:
             with open(config_path, "rb") as f:
                 data = tomllib.load(f)
@@ -93,6 +98,7 @@ class Config:
             exclude_patterns = config_data.get("exclude", [])
             max_violations = config_data.get("max_violations", None)
             public_submodules = config_data.get("public_submodules", [])
+            no_cache = config_data.get("no_cache", False)
 
             if not libraries:
                 return None
@@ -106,6 +112,7 @@ class Config:
                 exclude_patterns=exclude_patterns,
                 max_violations=max_violations,
                 public_submodules=public_submodules,
+                no_cache=no_cache,
             )
 
         except FileNotFoundError:
@@ -129,6 +136,7 @@ class Config:
         - CHECK_EXPORTS_EXCLUDE: Comma-separated exclude patterns
         - CHECK_EXPORTS_MAX_VIOLATIONS: Maximum violations threshold
         - CHECK_EXPORTS_PUBLIC_SUBMODULES: Comma-separated public submodules
+        - CHECK_EXPORTS_NO_CACHE: Set to 'true' to skip the on-disk scan cache
 
         Returns:
             Config object if env vars set, None otherwise
@@ -152,6 +160,7 @@ class Config:
 
         public_subs = os.getenv("CHECK_EXPORTS_PUBLIC_SUBMODULES", "").split(",")
         public_submodules = [s.strip() for s in public_subs if s.strip()]
+        no_cache = os.getenv("CHECK_EXPORTS_NO_CACHE", "").lower() == "true"
 
         return Config(
             libraries=libraries,
@@ -162,6 +171,7 @@ class Config:
             exclude_patterns=exclude_patterns,
             max_violations=max_violations,
             public_submodules=public_submodules,
+            no_cache=no_cache,
         )
 
     def to_dict(self) -> dict:
@@ -175,4 +185,5 @@ class Config:
             "exclude_patterns": self.exclude_patterns,
             "max_violations": self.max_violations,
             "public_submodules": self.public_submodules,
+            "no_cache": self.no_cache,
         }
@@ -2,7 +2,9 @@
 
 import ast
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
+
+from pre_commit_tools.check_exports.ast_utils import walk_statements
 
 
 def get_exported_functions(init_path: Path) -> Set[str]:
@@ -23,46 +25,49 @@ def get_exported_functions(init_path: Path) -> Set[str]:
         return set()
 
     try:
-        tree = ast.parse(init_path.read_text())
-    except SyntaxError:
+        # Parse the raw bytes: ast.parse decodes them itself (honouring PEP 263
+        # declarations), which avoids a separate text decode
+        tree = ast.parse(init_path.read_bytes(), filename=str(init_path))
+    except (SyntaxError, ValueError):
+        # SyntaxError also covers undecodable source; ValueError covers null bytes
         return set()
 
     exported = set()
+    all_list = None
 
-    # Check for __all__ definition
-    all_list = _get_all_list(tree)
-    if all_list:
-        exported.update(all_list)
-
-    # Find all function definitions
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
+    # Walk the module's statements once, collecting definitions, imports and __all__
+    # Parsed nodes are never subclassed, so exact type checks are safe and cheaper than isinstance
+    for node in walk_statements(tree):
+        if type(node) is ast.FunctionDef:
             exported.add(node.name)
-        elif isinstance(node, ast.ImportFrom):
+        elif type(node) is ast.ImportFrom:
             # Handle "from X import Y" statements
             for alias in node.names:
                 if alias.name != "*":
                     exported.add(alias.asname or alias.name)
-        elif isinstance(node, ast.Import):
+        elif type(node) is ast.Import:
             # Handle "import X" or "import X as Y"
             for alias in node.names:
                 exported.add(alias.asname or alias.name)
+        elif type(node) is ast.Assign and all_list is None:
+            all_list = _get_all_list(node)
+
+    # Check for __all__ definition
+    if all_list:
+        exported.update(all_list)
 
     return exported
 
 
-def _get_all_list(tree: ast.Module) -> Set[str]:
-    """Extract __all__ list from module if it exists."""
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Assign) and isinstance(node.value, ast.List):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "__all__":
-                    return {
-                        elt.value
-                        for elt in node.value.elts
-                        if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
-                    }
-    return set()
+def _get_all_list(node: ast.Assign) -> Optional[Set[str]]:
+    """Extract the __all__ list from an assignment, or None if it does not assign __all__."""
+    if isinstance(node.value, ast.List):
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id == "__all__":
+                return {
+                    elt.value for elt in node.value.elts if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                }
+    return None
 
 
 def get_library_root(lib_path: str) -> Path:
@@ -1,66 +1,311 @@
 """Detect function imports via AST parsing."""
 
+import ast
+import fnmatch
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from pre_commit_tools.check_exports.ast_utils import walk_statements
+from pre_commit_tools.check_exports.cache import (
+    FileImports,
+    FileStamp,
+    get_cache_file,
+    load_import_cache,
+    save_import_cache,
+)
 
-def find_imports_via_ast(lib_root: Path) -> Dict[str, List[Tuple[str, int]]]:
+# Minimum number of files to parse before parsing is spread across processes
+PARALLEL_PARSE_MIN_FILES = 64
+
+# Directories that never hold code importing the library (virtualenvs, VCS metadata,
+# caches, and build output holding copies of the library itself)
+PRUNED_DIRS = frozenset({".git", ".venv", "venv", "node_modules", "__pycache__", "build", "dist", ".tox"})
+
+
+def _compile_exclude_patterns(
+    exclude_patterns: List[str],
+) -> Tuple[Optional[re.Pattern[str]], Optional[re.Pattern[str]]]:
+    """
+    Compile exclude patterns into one regex for files and one for whole directories.
+
+    A pattern ending in "*" that matches "<dir>/" matches every path below that
+    directory too, so such directories can be skipped without being walked.
+
+    Args:
+        exclude_patterns: fnmatch-style patterns matched against file paths
+
+    Returns:
+        Tuple of (file regex, directory regex), None when there is nothing to match
+    """
+    if not exclude_patterns:
+        return None, None
+    file_re = re.compile("|".join(fnmatch.translate(p) for p in exclude_patterns))
+    dir_patterns = [p for p in exclude_patterns if p.endswith("*")]
+    dir_re = re.compile("|".join(fnmatch.translate(p) for p in dir_patterns)) if dir_patterns else None
+    return file_re, dir_re
+
+
+def _walk_python_files(
+    codebase_root: Path,
+    skipped_roots: frozenset[str],
+    exclude_patterns: List[str],
+) -> Iterator[os.DirEntry[str]]:
+    """
+    Walk the codebase once, yielding the Python files that may import the libraries.
+
+    PRUNED_DIRS, ``skipped_roots`` and excluded directories are pruned during the
+    walk rather than filtered afterwards, so they are never descended into.
+
+    Args:
+        codebase_root: Directory containing the libraries
+        skipped_roots: Directories not to walk at all (e.g. the only library being checked)
+        exclude_patterns: fnmatch-style patterns for files to skip
+
+    Yields:
+        os.DirEntry for every non-excluded .py file
+    """
+    file_re, dir_re = _compile_exclude_patterns(exclude_patterns)
+
+    stack = [str(codebase_root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (
+                            entry.name not in PRUNED_DIRS
+                            and entry.path not in skipped_roots
+                            and not (dir_re is not None and dir_re.match(entry.path + "/"))
+                        ):
+                            stack.append(entry.path)
+                    elif (
+                        entry.name.endswith(".py")
+                        and entry.is_file()
+                        and not (file_re is not None and file_re.match(entry.path))
+                    ):
+                        yield entry
+        except OSError:
+            # Unreadable directory, skip it
+            continue
+
+
+def _read_if_mentions(py_file: Path, needle: re.Pattern[bytes]) -> Optional[bytes]:
+    """
+    Read a file and return its raw bytes if ``needle`` matches somewhere in them.
+
+    Working on bytes means files that are filtered out are never decoded, and
+    ast.parse honours PEP 263 encoding declarations for the rest. A file that
+    never mentions a library cannot import from it, so this cheap check lets
+    most files skip the (much more expensive) full parse.
+
+    Args:
+        py_file: Path to Python source file
+        needle: Pattern matching the library names as whole words
+
+    Returns:
+        File contents, or None if the file is unreadable or does not mention a library
+    """
+    try:
+        source = py_file.read_bytes()
+    except OSError:
+        return None
+    return source if needle.search(source) else None
+
+
+def _collect_imports(source: bytes, lib_names: frozenset[str]) -> FileImports:
+    """
+    Parse one source file and collect its imports from any of ``lib_names``.
+
+    Args:
+        source: Raw file contents
+        lib_names: Names of the libraries being checked
+
+    Returns:
+        List of (import key, line number) pairs, empty if the file does not parse.
+        Every key starts with "<lib_name>."
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        # SyntaxError also covers undecodable source
+        return []
+
+    found: FileImports = []
+
+    # Find all imports from our target libraries; imports are statements, so expressions are skipped.
+    # Modules are matched on their first dotted component, so libraries that merely share a
+    # prefix (e.g. "mylibrary" for "mylib") are not attributed to the checked one.
+    # Parsed nodes are never subclassed, so exact type checks are safe and cheaper than isinstance
+    for node in walk_statements(tree):
+        if type(node) is ast.ImportFrom:
+            # Check if import is from one of our libraries
+            module = node.module
+            if module and module.partition(".")[0] in lib_names:
+                lineno = getattr(node, "lineno", 0)
+                for alias in node.names:
+                    func_name = alias.name
+                    # Skip star imports (*) - they respect __all__ automatically
+                    if func_name == "*":
+                        continue
+                    # Build full import path
+                    # e.g. "from mylib import foo" -> "mylib.foo"
+                    # e.g. "from mylib.sub import foo" -> "mylib.sub.foo"
+                    found.append((f"{module}.{func_name}", lineno))
+        elif type(node) is ast.Import:
+            # Handle direct imports like "import lib.module.function"
+            lineno = getattr(node, "lineno", 0)
+            for alias in node.names:
+                lib_name = alias.name.partition(".")[0]
+                if lib_name in lib_names:
+                    func_name = alias.name.split(".")[-1]
+                    found.append((f"{lib_name}.{func_name}", lineno))
+
+    return found
+
+
+def find_imports_via_ast(
+    lib_root: Path,
+    use_cache: bool = True,
+    exclude_patterns: Optional[List[str]] = None,
+) -> Dict[str, List[Tuple[str, int]]]:
     """
     Find function imports by parsing all Python files in the codebase.
 
+    Results for each file are cached on disk, keyed on its modification time and
+    size, so repeated runs only read and parse the files that changed.
+
     Args:
         lib_root: Path to library being checked
+        use_cache: Whether to read and update the on-disk scan cache
+        exclude_patterns: fnmatch-style patterns for files to skip entirely
 
     Returns:
         Dict mapping (lib_name, function_name) to list of file:line locations
     """
-    import ast
+    return find_imports_for_libraries([lib_root], use_cache, exclude_patterns)[lib_root]
 
-    lib_name = lib_root.name
-    codebase_root = lib_root.parent
-    imports: Dict[str, List[Tuple[str, int]]] = {}
 
-    # Walk all Python files in codebase
-    for py_file in codebase_root.rglob("*.py"):
-        # Skip the library itself - we only care about external imports
-        if py_file.is_relative_to(lib_root):
-            continue
+def find_imports_for_libraries(
+    lib_roots: List[Path],
+    use_cache: bool = True,
+    exclude_patterns: Optional[List[str]] = None,
+) -> Dict[Path, Dict[str, List[Tuple[str, int]]]]:
+    """
+    Find imports of several sibling libraries with a single walk and parse of the codebase.
+
+    Each file is read and parsed at most once, however many libraries it imports
+    from. A library's own files are left out of its results, since only external
+    imports matter.
+
+    Args:
+        lib_roots: Paths to libraries being checked; they must share a parent directory
+        use_cache: Whether to read and update the on-disk scan cache
+        exclude_patterns: fnmatch-style patterns for files to skip entirely
 
+    Returns:
+        Dict mapping each library root to the result find_imports_via_ast gives for it
+
+    Raises:
+        ValueError: If the libraries do not share a parent directory
+    """
+    lib_roots = list(dict.fromkeys(lib_roots))
+    codebase_root = lib_roots[0].parent
+    if any(lib_root.parent != codebase_root for lib_root in lib_roots):
+        raise ValueError("Libraries must share a parent directory")
+
+    lib_names = frozenset(lib_root.name for lib_root in lib_roots)
+    # Whole-word match, so names that merely contain a library name (e.g. "mylibrary"
+    # for "mylib") do not force a parse
+    lib_names_re = re.compile(rb"\b(?:" + b"|".join(re.escape(name.encode()) for name in sorted(lib_names)) + rb")\b")
+    cache_file = get_cache_file(codebase_root, lib_names)
+    cached = load_import_cache(cache_file) if use_cache else {}
+
+    # Collect all Python files in codebase. With a single library its own files are
+    # never needed, so it is not walked at all; with several, each library's files
+    # may import the others.
+    skipped_roots = frozenset({str(lib_roots[0])}) if len(lib_roots) == 1 else frozenset()
+    py_entries = list(_walk_python_files(codebase_root, skipped_roots, exclude_patterns or []))
+
+    # Reuse cached results for unchanged files
+    file_imports: Dict[str, FileImports] = {}
+    stamps: Dict[str, FileStamp] = {}
+    stale_files: List[Path] = []
+    for entry in py_entries:
+        file_path = entry.path
         try:
-            tree = ast.parse(py_file.read_text())
-        except (SyntaxError, UnicodeDecodeError):
+            stat = entry.stat()
+        except OSError:
+            # Vanished or unreadable; let the read below decide
+            stale_files.append(Path(file_path))
             continue
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        stamps[file_path] = stamp
+        cached_entry = cached.get(file_path)
+        if cached_entry is not None and cached_entry[0] == stamp:
+            file_imports[file_path] = cached_entry[1]
+        else:
+            stale_files.append(Path(file_path))
 
-        # Find all imports from our target library
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom):
-                # Check if import is from our library
-                if node.module and node.module.startswith(lib_name):
-                    lineno = getattr(node, "lineno", 0)
-                    for alias in node.names:
-                        func_name = alias.name
-                        # Skip star imports (*) - they respect __all__ automatically
-                        if func_name == "*":
-                            continue
-                        # Build full import path
-                        # e.g. "from mylib.sub import foo" -> "mylib.sub.foo"
-                        if node.module == lib_name:
-                            key = f"{lib_name}.{func_name}"
-                        else:
-                            # node.module is like "mylib.sub"
-                            key = f"{node.module}.{func_name}"
-                        if key not in imports:
-                            imports[key] = []
-                        imports[key].append((str(py_file), lineno))
-            elif isinstance(node, ast.Import):
-                # Handle direct imports like "import lib.module.function"
-                lineno = getattr(node, "lineno", 0)
-                for alias in node.names:
-                    if alias.name.startswith(lib_name):
-                        func_name = alias.name.split(".")[-1]
-                        key = f"{lib_name}.{func_name}"
-                        if key not in imports:
-                            imports[key] = []
-                        imports[key].append((str(py_file), lineno))
-
-    return imports
+    # Parsing holds the GIL, so batches that can reach PARALLEL_PARSE_MIN_FILES are
+    # spread across processes; smaller ones are not worth the worker startup and
+    # pickling cost and are parsed here instead, as is everything on a single CPU
+    workers = os.cpu_count() or 1
+    parse_inline = workers <= 1 or len(stale_files) < PARALLEL_PARSE_MIN_FILES
+    candidate_sources: List[bytes] = []
+    candidate_paths: List[str] = []
+
+    # Reads release the GIL, so a thread pool keeps reading ahead while earlier
+    # files are filtered (and, inline, parsed) on this thread
+    with ThreadPoolExecutor() as executor:
+        sources = executor.map(_read_if_mentions, stale_files, repeat(lib_names_re))
+
+        for py_file, source in zip(stale_files, sources):
+            file_path = str(py_file)
+            if source is None:
+                file_imports[file_path] = []
+            elif parse_inline:
+                file_imports[file_path] = _collect_imports(source, lib_names)
+            else:
+                candidate_sources.append(source)
+                candidate_paths.append(file_path)
+
+    if len(candidate_sources) >= PARALLEL_PARSE_MIN_FILES:
+        # multiprocessing is slow to import, so only load it when it is used
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _collect_imports,
+                    candidate_sources,
+                    repeat(lib_names),
+                    chunksize=max(1, len(candidate_sources) // (workers * 4)),
+                )
+            )
+    else:
+        results = [_collect_imports(source, lib_names) for source in candidate_sources]
+
+    file_imports.update(zip(candidate_paths, results))
+
+    if use_cache and stale_files:
+        save_import_cache(
+            cache_file,
+            {file_path: (stamp, file_imports[file_path]) for file_path, stamp in stamps.items()},
+        )
+
+    # Split per library and merge in file order, so the result does not depend on
+    # what was cached
+    imports: Dict[str, Dict[str, List[Tuple[str, int]]]] = {name: {} for name in lib_names}
+    own_prefixes = {lib_root.name: str(lib_root) + os.sep for lib_root in lib_roots}
+    for entry in py_entries:
+        file_path = entry.path
+        for key, lineno in file_imports[file_path]:
+            lib_name = key.partition(".")[0]
+            if not file_path.startswith(own_prefixes[lib_name]):
+                imports[lib_name].setdefault(key, []).append((file_path, lineno))
+
+    return {lib_root: imports[lib_root.name] for lib_root in lib_roots}
@@ -12,6 +12,9 @@ GREEN = "\033[92m"
 BOLD = "\033[1m"
 RESET = "\033[0m"
 
+# JSON output is read by tools, so skip the whitespace json.dumps adds by default
+JSON_SEPARATORS = (",", ":")
+
 # Global flag for color support
 _use_colors = True
 
@@ -88,7 +91,7 @@ def report_violations_json(violations: List[Violation]) -> None:
         "violations": violations_list,
     }
 
-    print(json.dumps(output, indent=2))
+    print(json.dumps(output, separators=JSON_SEPARATORS))
 
 
 def report_success(
@@ -100,7 +103,7 @@ def report_success(
     set_use_colors(use_colors)
 
     if format == "json":
-        print(json.dumps({"status": "ok", "message": message}))
+        print(json.dumps({"status": "ok", "message": message}, separators=JSON_SEPARATORS))
     else:
         print(_colorize(message, GREEN))
 
@@ -124,7 +127,7 @@ def report_summary(
             "violations": violations_count,
             "execution_time_ms": round(execution_time * 1000, 2),
         }
-        print(json.dumps(summary))
+        print(json.dumps(summary, separators=JSON_SEPARATORS))
     else:
         summary_text = (
             f"\n{_colorize('Summary:', BOLD)}\n"
@@ -1,14 +1,17 @@
 """Validate that non-exported functions are not imported from outside the library."""
 
+import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple, TypedDict
+from typing import Dict, List, Optional, Tuple, TypedDict
 
 from pre_commit_tools.check_exports.export_parser import (
     get_exported_functions,
     get_init_path,
     get_library_root,
 )
-from pre_commit_tools.check_exports.import_detector import find_imports_via_ast
+from pre_commit_tools.check_exports.import_detector import find_imports_for_libraries, find_imports_via_ast
 
 
 class SingleLibraryStats(TypedDict):
@@ -31,9 +34,12 @@ class AggregatedStats(TypedDict):
     total_execution_time: float
 
 
+@dataclass(frozen=True, slots=True, repr=False)
 class Violation:
     """Represents an import violation.
 
+    Violations are created in bulk, so they use slots instead of a per-instance __dict__.
+
     Attributes:
         lib_name: Name of the library where violation occurred
         func_name: Name of the non-exported function that was imported
@@ -43,43 +49,25 @@ class Violation:
         hint: Optional suggestion for fixing the violation
     """
 
-    def __init__(
-        self,
-        lib_name: str,
-        func_name: str,
-        file_path: str,
-        line_num: int,
-        is_warning: bool = False,
-        hint: Optional[str] = None,
-    ) -> None:
-        """Initialize a violation.
-
-        Args:
-            lib_name: Name of the library being imported from
-            func_name: Name of the non-exported function
-            file_path: Path to file containing the import
-            line_num: Line number of the import statement
-            is_warning: If True, this is a warning
-            hint: Optional suggestion
-        """
-        self.lib_name = lib_name
-        self.func_name = func_name
-        self.file_path = file_path
-        self.line_num = line_num
-        self.is_warning = is_warning
-        self.hint = hint
+    lib_name: str
+    func_name: str
+    file_path: str
+    line_num: int
+    is_warning: bool = False
+    hint: Optional[str] = None
 
     def __repr__(self) -> str:
         prefix = "WARN" if self.is_warning else "ERR"
-        msg = (
-            f"[{prefix}] {self.file_path}:{self.line_num}: Function '{self.func_name}' "
-            f"is not exported from '{self.lib_name}'"
-        )
         if self.is_warning:
             msg = (
                 f"[{prefix}] {self.file_path}:{self.line_num}: Symbol '{self.func_name}' "
                 f"is exported from '{self.lib_name}' but starts with underscore"
             )
+        else:
+            msg = (
+                f"[{prefix}] {self.file_path}:{self.line_num}: Function '{self.func_name}' "
+                f"is not exported from '{self.lib_name}'"
+            )
 
         if self.hint:
             msg += f"\n              → {self.hint}"
@@ -95,6 +83,8 @@ def validate_library(
     exclude_patterns: Optional[List[str]] = None,
     public_submodules: Optional[List[str]] = None,
     verbose: bool = False,
+    use_cache: bool = True,
+    imports: Optional[Dict[str, List[Tuple[str, int]]]] = None,
 ) -> Tuple[List[Violation], SingleLibraryStats]:
     """
     Validate that no non-exported functions are imported from outside the library.
@@ -103,44 +93,48 @@ def validate_library(
         lib_path: Path to library to check
         exclude_patterns: List of patterns to exclude from checking
         verbose: Whether to return statistics
+        use_cache: Whether to read and update the on-disk scan cache
+        imports: Imports of the library already found by find_imports_for_libraries;
+            the codebase is scanned when not given
 
     Returns:
         Tuple of (violations list, statistics dict)
     """
-    import fnmatch
-    import time
-
     start_time = time.time()
     exclude_patterns = exclude_patterns or []
-    public_submodules_set = set(public_submodules or [])
+    public_submodules_set = frozenset(public_submodules or [])
+    # str.startswith accepts a tuple and checks every prefix in one call
+    public_submodule_prefixes = tuple(submod + "." for submod in public_submodules_set)
 
     lib_root = get_library_root(lib_path)
     lib_name = lib_root.name
 
     # Get all exported functions
     init_path = get_init_path(lib_root)
-    exported = get_exported_functions(init_path)
-
-    # Find all imports
-    imports = find_imports_via_ast(lib_root)
-
-    violations: List[Violation] = []
-
-    # Check for underscore exports (Warnings)
-    for func in exported:
-        if func.startswith("_"):
-            # We don't have a specific file/line for the export definition easily available
-            # so we'll just report it as a general warning for the library init
-            violations.append(
-                Violation(
-                    lib_name,
-                    func,
-                    str(init_path),
-                    1,
-                    is_warning=True,
-                    hint="Symbols starting with underscore should not be exported in __init__.py",
-                )
-            )
+    exported = frozenset(get_exported_functions(init_path))
+    # Files inside the library are recognised by a plain string prefix
+    lib_root_prefix = str(lib_root) + os.sep
+
+    # Find all imports; excluded files are skipped during the walk, before they are parsed
+    if imports is None:
+        imports = find_imports_via_ast(lib_root, use_cache=use_cache, exclude_patterns=exclude_patterns)
+
+    # Check for underscore exports (Warnings); they all point at the same __init__.py
+    # We don't have a specific file/line for the export definition easily available
+    # so we'll just report it as a general warning for the library init
+    init_path_str = str(init_path)
+    violations: List[Violation] = [
+        Violation(
+            lib_name,
+            func,
+            init_path_str,
+            1,
+            is_warning=True,
+            hint="Symbols starting with underscore should not be exported in __init__.py",
+        )
+        for func in exported
+        if func.startswith("_")
+    ]
 
     for import_key, locations in imports.items():
         # import_key can be:
@@ -162,32 +156,15 @@ def validate_library(
 
         # Check if it's a public submodule import
         # e.g. relative_path="sub.foo", public_submodules=["sub"]
-        is_public_submodule = False
-        for submod in public_submodules_set:
-            if relative_path == submod or relative_path.startswith(submod + "."):
-                is_public_submodule = True
-                break
-
-        if is_public_submodule:
+        if relative_path in public_submodules_set or relative_path.startswith(public_submodule_prefixes):
             continue
 
         # If we get here, it's a violation
-        # Check each location to see if it's external
-        for file_path, line_num in locations:
-            file_p = Path(file_path)
-
-            # Check if file matches exclude patterns
-            should_exclude = False
-            for pattern in exclude_patterns:
-                if fnmatch.fnmatch(str(file_p), pattern):
-                    should_exclude = True
-                    break
-
-            if should_exclude:
-                continue
-
+        # Check each location to see if it's external; a statement such as
+        # "import mylib.a.helper, mylib.b.helper" records the same location twice
+        for file_path, line_num in dict.fromkeys(locations):
             # If the importing file is inside the library, it's an internal import (allowed)
-            if not file_p.is_relative_to(lib_root):
+            if not file_path.startswith(lib_root_prefix):
                 # Generate hint
                 hint = None
                 if "." in relative_path:
@@ -200,7 +177,7 @@ def validate_library(
                         # Deeper nesting
                         hint = f"Consider adding '{parts[0]}' to public_submodules or restructuring exports"
 
-                violations.append(Violation(lib_name, relative_path, str(file_path), line_num, hint=hint))
+                violations.append(Violation(lib_name, relative_path, file_path, line_num, hint=hint))
 
     # Calculate statistics
     stats: SingleLibraryStats = {
@@ -219,6 +196,7 @@ def validate_libraries(
     exclude_patterns: Optional[List[str]] = None,
     public_submodules: Optional[List[str]] = None,
     verbose: bool = False,
+    use_cache: bool = True,
 ) -> Tuple[List[Violation], AggregatedStats]:
     """
     Validate multiple libraries.
@@ -227,6 +205,7 @@ def validate_libraries(
         lib_paths: List of library paths to check
         exclude_patterns: List of patterns to exclude from checking
         verbose: Whether to return statistics
+        use_cache: Whether to read and update the on-disk scan cache
 
     Returns:
         Tuple of (combined violations list, statistics dict)
@@ -240,8 +219,45 @@ def validate_libraries(
         "total_execution_time": 0.0,
     }
 
-    for lib_path in lib_paths:
-        violations, stats = validate_library(lib_path, exclude_patterns, public_submodules, verbose)
+    results: Dict[int, Tuple[List[Violation], SingleLibraryStats]] = {}
+
+    # Libraries under the same parent would each walk and parse that same codebase,
+    # so scan it once for all of them and validate against the shared result.
+    # Libraries are validated in this process: a process pool per library costs far
+    # more to start than small libraries take to check, and large scans already
+    # spread their parsing across processes in find_imports_for_libraries.
+    groups: Dict[Path, List[int]] = {}
+    lib_roots = [get_library_root(lib_path) for lib_path in lib_paths]
+    for index, lib_root in enumerate(lib_roots):
+        groups.setdefault(lib_root.parent, []).append(index)
+
+    for indices in groups.values():
+        group_roots = [lib_roots[index] for index in indices]
+        if len(set(group_roots)) < 2:
+            for index in indices:
+                results[index] = validate_library(
+                    lib_paths[index], exclude_patterns, public_submodules, verbose, use_cache
+                )
+            continue
+
+        start_time = time.time()
+        group_imports = find_imports_for_libraries(group_roots, use_cache, exclude_patterns)
+        # Share the scan time between the libraries that used it
+        scan_time = (time.time() - start_time) / len(indices)
+        for index in indices:
+            violations, stats = validate_library(
+                lib_paths[index],
+                exclude_patterns,
+                public_submodules,
+                verbose,
+                use_cache,
+                imports=group_imports[lib_roots[index]],
+            )
+            stats["execution_time"] += scan_time
+            results[index] = (violations, stats)
+
+    for index in range(len(lib_paths)):
+        violations, stats = results[index]
         all_violations.extend(violations)
 
         all_stats["libraries"].append(stats)
@@ -2,125 +2,262 @@
 
 import argparse
 import fnmatch
+import functools
 import json
+import operator
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
-
-# Try to import TOML library (tomllib for Python 3.11+, tomli as fallback)
-try:
-    import tomllib as toml_lib
-except ImportError:
-    try:
-        import tomli as toml_lib
-    except ImportError:
-        toml_lib = None  # type: ignore[assignment]
+from typing import Any, Optional
 
 from .config import PreCommitConfig
 
+# TOML library (tomllib for Python 3.11+, tomli as fallback), imported on first use
+# so that projects without a pyproject.toml never pay for it. None means unavailable.
+_NOT_LOADED: Any = object()
+toml_lib: Any = _NOT_LOADED
+
+
+def _get_toml_lib() -> Any:
+    """Return the TOML library, importing it on first use (None if unavailable)."""
+    global toml_lib
+    if toml_lib is _NOT_LOADED:
+        try:
+            import tomllib
+
+            toml_lib = tomllib
+        except ImportError:
+            try:
+                import tomli
+
+                toml_lib = tomli
+            except ImportError:
+                toml_lib = None
+    return toml_lib
+
+
 # Constants for ignored directories and files
-ALWAYS_IGNORED_DIRS = {".git", ".venv", "venv", "env", "node_modules", "__pycache__"}
-
-DEFAULT_GITIGNORE_PATTERNS = {
-    "__pycache__/",
-    "node_modules/",
-    ".venv/",
-    "venv/",
-    "env/",
-    "build/",
-    "dist/",
-    ".pytest_cache/",
-    ".pyrefly_cache/",
-    ".ruff_cache/",
-}
+ALWAYS_IGNORED_DIRS = frozenset({".git", ".venv", "venv", "env", "node_modules", "__pycache__"})
+
+DEFAULT_GITIGNORE_PATTERNS = frozenset(
+    {
+        "__pycache__/",
+        "node_modules/",
+        ".venv/",
+        "venv/",
+        "env/",
+        "build/",
+        "dist/",
+        ".pytest_cache/",
+        ".pyrefly_cache/",
+        ".ruff_cache/",
+    }
+)
 
 # Technology detection indicators
-PYTHON_INDICATORS = {
-    "setup.py",
-    "pyproject.toml",
-    "requirements.txt",
-    "pipfile",
-    "poetry.lock",
-    "setup.cfg",
-    "tox.ini",
-    "pytest.ini",
-    ".py",
-    "manage.py",
-    "__init__.py",
-}
-
-JAVASCRIPT_INDICATORS = {
-    "package.json",
-    "yarn.lock",
-    "package-lock.json",
-    "npm-shrinkwrap.json",
-    ".js",
-    ".mjs",
-    ".cjs",
-    "webpack.config.js",
-    "vite.config.js",
-    "rollup.config.js",
-    "babel.config.js",
-    ".babelrc",
-}
-
-TYPESCRIPT_INDICATORS = {
-    "tsconfig.json",
-    "tsconfig.base.json",
-    "tsconfig.build.json",
-    ".ts",
-    ".tsx",
-    ".d.ts",
-}
-
-JSX_INDICATORS = {
-    ".jsx",
-    ".tsx",
-    "next.config.js",
-    "gatsby-config.js",
-    "react-scripts",
-    ".storybook",
-}
-
-GO_INDICATORS = {"go.mod", "go.sum", "main.go", ".go", "vendor"}
-
-DOCKER_INDICATORS = {
-    "dockerfile",
-    "docker-compose.yml",
-    "docker-compose.yaml",
-    ".dockerignore",
-    "dockerfile.dev",
-    "dockerfile.prod",
-}
-
-YAML_FILE_INDICATORS = {".yml", ".yaml", "docker-compose.yml", "docker-compose.yaml"}
-JSON_FILE_INDICATORS = {".json"}
-TOML_FILE_INDICATORS = {".toml", "pyproject.toml"}
-XML_FILE_INDICATORS = {".xml"}
+PYTHON_INDICATORS = frozenset(
+    {
+        "setup.py",
+        "pyproject.toml",
+        "requirements.txt",
+        "pipfile",
+        "poetry.lock",
+        "setup.cfg",
+        "tox.ini",
+        "pytest.ini",
+        ".py",
+        "manage.py",
+        "__init__.py",
+    }
+)
+
+JAVASCRIPT_INDICATORS = frozenset(
+    {
+        "package.json",
+        "yarn.lock",
+        "package-lock.json",
+        "npm-shrinkwrap.json",
+        ".js",
+        ".mjs",
+        ".cjs",
+        "webpack.config.js",
+        "vite.config.js",
+        "rollup.config.js",
+        "babel.config.js",
+        ".babelrc",
+    }
+)
+
+TYPESCRIPT_INDICATORS = frozenset(
+    {
+        "tsconfig.json",
+        "tsconfig.base.json",
+        "tsconfig.build.json",
+        ".ts",
+        ".tsx",
+        ".d.ts",
+    }
+)
+
+JSX_INDICATORS = frozenset(
+    {
+        ".jsx",
+        ".tsx",
+        "next.config.js",
+        "gatsby-config.js",
+        "react-scripts",
+        ".storybook",
+    }
+)
+
+GO_INDICATORS = frozenset({"go.mod", "go.sum", "main.go", ".go", "vendor"})
+
+DOCKER_INDICATORS = frozenset(
+    {
+        "dockerfile",
+        "docker-compose.yml",
+        "docker-compose.yaml",
+        ".dockerignore",
+        "dockerfile.dev",
+        "dockerfile.prod",
+    }
+)
+
+YAML_FILE_INDICATORS = frozenset({".yml", ".yaml", "docker-compose.yml", "docker-compose.yaml"})
+JSON_FILE_INDICATORS = frozenset({".json"})
+TOML_FILE_INDICATORS = frozenset({".toml", "pyproject.toml"})
+XML_FILE_INDICATORS = frozenset({".xml"})
+
+# One bit per detected category, so all categories are classified in a single pass
+PYTHON_BIT = 1 << 0
+UV_LOCK_BIT = 1 << 1
+JAVASCRIPT_BIT = 1 << 2
+TYPESCRIPT_BIT = 1 << 3
+JSX_BIT = 1 << 4
+GO_BIT = 1 << 5
+DOCKER_BIT = 1 << 6
+YAML_FILE_BIT = 1 << 7
+JSON_FILE_BIT = 1 << 8
+TOML_FILE_BIT = 1 << 9
+XML_FILE_BIT = 1 << 10
+
+
+def _build_indicator_bits() -> dict[str, int]:
+    """Map every indicator file name or extension to the bits of the categories it signals."""
+    categories = [
+        (PYTHON_BIT, PYTHON_INDICATORS),
+        (UV_LOCK_BIT, frozenset({"uv.lock"})),
+        (JAVASCRIPT_BIT, JAVASCRIPT_INDICATORS),
+        (TYPESCRIPT_BIT, TYPESCRIPT_INDICATORS),
+        (JSX_BIT, JSX_INDICATORS),
+        (GO_BIT, GO_INDICATORS),
+        (DOCKER_BIT, DOCKER_INDICATORS),
+        (YAML_FILE_BIT, YAML_FILE_INDICATORS),
+        (JSON_FILE_BIT, JSON_FILE_INDICATORS),
+        (TOML_FILE_BIT, TOML_FILE_INDICATORS),
+        (XML_FILE_BIT, XML_FILE_INDICATORS),
+    ]
+    indicator_bits: dict[str, int] = {}
+    for bit, indicators in categories:
+        for indicator in indicators:
+            indicator_bits[indicator] = indicator_bits.get(indicator, 0) | bit
+    return indicator_bits
+
+
+INDICATOR_BITS = _build_indicator_bits()
+ALL_INDICATOR_BITS = functools.reduce(operator.or_, INDICATOR_BITS.values())
+
+# Tool config files, in order of preference
+PRETTIER_CONFIG_FILES = [
+    ".prettierrc",
+    ".prettierrc.json",
+    ".prettierrc.yml",
+    ".prettierrc.yaml",
+    ".prettierrc.js",
+    "prettier.config.js",
+]
+ESLINT_CONFIG_FILES = [
+    ".eslintrc",
+    ".eslintrc.json",
+    ".eslintrc.yml",
+    ".eslintrc.yaml",
+    ".eslintrc.js",
+    "eslint.config.js",
+]
+PRETTIER_CONFIG_PRIORITY = {name: rank for rank, name in enumerate(PRETTIER_CONFIG_FILES)}
+ESLINT_CONFIG_PRIORITY = {name: rank for rank, name in enumerate(ESLINT_CONFIG_FILES)}
+
+# Root files detect_python_version reads
+PYTHON_VERSION_FILES = frozenset({".python-version", "pyproject.toml"})
+
+# Lower bound of a requires-python specifier, e.g. ">=3.10, <4" -> "3.10"
+REQUIRES_PYTHON_RE = re.compile(r">=\s*([\d.]+)")
+
+# First character that can follow a package name in a requirement string
+DEPENDENCY_NAME_END_RE = re.compile(r"[\[<>=~!;@\s]")
+
+
+# Package name at the start of each requirements line, skipping blank lines, comments
+# and options such as "-r other.txt" or "--index-url"
+REQUIREMENT_NAME_RE = re.compile(r"^[^\S\n]*(?![#-])([^\[<>=~!;@\s]+)", re.MULTILINE)
 
 
 def extract_package_name(dep: str) -> str:
-    """Extract package name from dependency string (removes version specifiers)."""
-    return re.split(r"[>=~<]", dep)[0].strip()
+    """Extract package name from dependency string (removes extras, version specifiers and markers)."""
+    return DEPENDENCY_NAME_END_RE.split(dep.strip(), 1)[0]
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_pyproject_cached(pyproject_path: str, mtime_ns: int) -> Optional[dict]:
+    """Parse and cache a pyproject.toml, keyed on path and modification time.
+
+    The returned data is shared between callers and must not be mutated.
+    """
+    try:
+        with open(pyproject_path, "rb") as f:
+            return _get_toml_lib().load(f)
+    except (OSError, ValueError):
+        # OSError: file reading issues
+        # ValueError: TOML parsing errors
+        return None
 
 
-def _read_pyproject_dependencies(pyproject_file: Path) -> set[str]:
-    """Read dependencies from pyproject.toml file.
+def _load_pyproject(path: Path) -> Optional[dict]:
+    """Parse a project's pyproject.toml.
 
     Args:
-        pyproject_file: Path to pyproject.toml
+        path: Path to project directory
+
+    Returns:
+        Parsed TOML data, or None if the file is missing or unreadable
+    """
+    toml = _get_toml_lib()
+    if not toml:
+        return None
+
+    pyproject_file = path / "pyproject.toml"
+    try:
+        mtime_ns = pyproject_file.stat().st_mtime_ns
+    except OSError:
+        # Missing file
+        return None
+
+    return _parse_pyproject_cached(str(pyproject_file.resolve()), mtime_ns)
+
+
+def _read_pyproject_dependencies(data: dict) -> set[str]:
+    """Read dependencies from parsed pyproject.toml data.
+
+    Args:
+        data: Parsed pyproject.toml contents
 
     Returns:
         Set of package names found in the file
     """
     dependencies = set()
-    if not pyproject_file.exists() or not toml_lib:
-        return dependencies
 
     try:
-        with open(pyproject_file, "rb") as f:
-            data = toml_lib.load(f)
-
         # Get dependencies from project.dependencies
         if "project" in data and "dependencies" in data["project"]:
             for dep in data["project"]["dependencies"]:
@@ -132,10 +269,8 @@ def _read_pyproject_dependencies(pyproject_file: Path) -> set[str]:
                 for dep in group:
                     dependencies.add(extract_package_name(dep))
 
-    except (OSError, ValueError, KeyError):
-        # OSError: file reading issues
-        # ValueError: TOML parsing errors
-        # KeyError: unexpected structure
+    except (AttributeError, KeyError, TypeError):
+        # Unexpected structure
         pass
 
     return dependencies
@@ -150,29 +285,23 @@ def _read_requirements_file(req_path: Path) -> set[str]:
     Returns:
         Set of package names found in the file
     """
-    dependencies = set()
-    if not req_path.exists():
-        return dependencies
-
     try:
         with open(req_path, encoding="utf-8") as f:
-            for raw_line in f:
-                line = raw_line.strip()
-                if line and not line.startswith("#") and not line.startswith("-"):
-                    dependencies.add(extract_package_name(line))
+            content = f.read()
     except (OSError, UnicodeDecodeError):
-        # OSError: file reading issues
+        # OSError: missing file or file reading issues
         # UnicodeDecodeError: binary files or encoding issues
-        pass
+        return set()
 
-    return dependencies
+    return set(REQUIREMENT_NAME_RE.findall(content))
 
 
-def detect_project_dependencies(path: Path) -> set[str]:
+def detect_project_dependencies(path: Path, pyproject_data: Optional[dict] = None) -> set[str]:
     """Detect project dependencies from pyproject.toml, requirements.txt, etc.
 
     Args:
         path: Path to project directory
+        pyproject_data: Already-parsed pyproject.toml (read from disk if None)
 
     Returns:
         Set of all detected package names
@@ -180,7 +309,10 @@ def detect_project_dependencies(path: Path) -> set[str]:
     dependencies = set()
 
     # Check pyproject.toml
-    dependencies.update(_read_pyproject_dependencies(path / "pyproject.toml"))
+    if pyproject_data is None:
+        pyproject_data = _load_pyproject(path)
+    if pyproject_data:
+        dependencies.update(_read_pyproject_dependencies(pyproject_data))
 
     # Check requirements.txt files
     for req_file in ["requirements.txt", "requirements-dev.txt", "dev-requirements.txt"]:
@@ -189,59 +321,144 @@ def detect_project_dependencies(path: Path) -> set[str]:
     return dependencies
 
 
+@functools.lru_cache(maxsize=32)
+def _read_gitignore_cached(gitignore_path: str, mtime_ns: int) -> frozenset[str]:
+    """Read and cache .gitignore patterns, keyed on path and modification time.
+
+    Read errors propagate so that failures are not cached.
+    """
+    patterns = set()
+    with open(gitignore_path, encoding="utf-8") as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            # Skip empty lines and comments
+            if line and not line.startswith("#"):
+                patterns.add(line)
+    return frozenset(patterns)
+
+
 def read_gitignore_patterns(path: Path) -> set[str]:
     """Read .gitignore file and return patterns."""
     gitignore_file = path / ".gitignore"
-    patterns = set()
 
-    if gitignore_file.exists():
-        try:
-            with open(gitignore_file, encoding="utf-8") as f:
-                for raw_line in f:
-                    line = raw_line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith("#"):
-                        patterns.add(line)
-        except (OSError, UnicodeDecodeError):
-            # If we can't read gitignore, continue without it
-            # OSError: file reading issues
-            # UnicodeDecodeError: binary or encoding issues
-            pass
-
-    return patterns
-
-
-def is_ignored_by_gitignore(file_path: Path, project_root: Path, gitignore_patterns: set[str]) -> bool:
-    """Check if a file should be ignored based on gitignore patterns."""
+    try:
+        mtime_ns = gitignore_file.stat().st_mtime_ns
+        return set(_read_gitignore_cached(str(gitignore_file.resolve()), mtime_ns))
+    except (OSError, UnicodeDecodeError):
+        # If we can't read gitignore, continue without it
+        # OSError: missing file or file reading issues
+        # UnicodeDecodeError: binary or encoding issues
+        return set()
+
+
+# Characters that make a gitignore pattern a glob rather than a literal
+GLOB_META_CHARS = frozenset("*?[")
+
+
+def _literal_suffix(pattern: str) -> Optional[str]:
+    """Return the literal suffix of a "*<literal>" pattern such as "*.pyc", else None."""
+    if pattern.startswith("*") and "/" not in pattern and GLOB_META_CHARS.isdisjoint(pattern[1:]):
+        return pattern[1:]
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_gitignore_patterns(
+    gitignore_patterns: frozenset[str],
+) -> tuple[frozenset[str], Optional[re.Pattern[str]], Optional[re.Pattern[str]], tuple[str, ...]]:
+    """Compile gitignore patterns into one cached regex per pattern kind.
+
+    The common literal forms are kept out of the regexes: directory patterns without
+    glob characters (e.g. "build/") become an exact-path set, and file patterns of the
+    form "*<literal>" (e.g. "*.pyc") are checked with a single str.endswith call.
+
+    Args:
+        gitignore_patterns: Patterns as read from .gitignore
+
+    Returns:
+        Tuple of (literal directory paths, directory pattern regex, file pattern regex,
+        literal file suffixes), with a regex of None when a kind has no patterns
+    """
+    dir_literals = set()
+    dir_patterns = []
+    file_patterns = []
+    file_suffixes = []
+    for pattern in gitignore_patterns:
+        if pattern.endswith("/"):
+            if GLOB_META_CHARS.isdisjoint(pattern):
+                dir_literals.add(pattern[:-1])
+            else:
+                dir_patterns.append(pattern[:-1])
+            continue
+
+        suffix = _literal_suffix(pattern)
+        if suffix:
+            file_suffixes.append(suffix)
+        else:
+            # Globs, plain names, and a bare "*" (which matches everything)
+            file_patterns.append(pattern)
+
+    dir_regex = re.compile("|".join(fnmatch.translate(p) for p in dir_patterns)) if dir_patterns else None
+    file_regex = re.compile("|".join(fnmatch.translate(p) for p in file_patterns)) if file_patterns else None
+    return frozenset(dir_literals), dir_regex, file_regex, tuple(sorted(file_suffixes))
+
+
+def _is_ignored_entry(
+    rel_path: str,
+    name: str,
+    dir_literals: frozenset[str],
+    dir_regex: Optional[re.Pattern[str]],
+    file_regex: Optional[re.Pattern[str]],
+    file_suffixes: tuple[str, ...],
+) -> bool:
+    """Check a relative path against compiled gitignore patterns."""
+    if rel_path in dir_literals:
+        return True
+    if dir_regex is not None and dir_regex.match(rel_path):
+        return True
+    if file_suffixes and name.endswith(file_suffixes):
+        return True
+    if file_regex is not None and (file_regex.match(rel_path) or file_regex.match(name)):
+        return True
+    return False
+
+
+def is_ignored_by_gitignore(file_path: Path, project_root: Path, gitignore_patterns: set[str] | frozenset[str]) -> bool:
+    """Check if a file should be ignored based on gitignore patterns.
+
+    Patterns are split and compiled once per distinct pattern set. Callers checking many
+    files should pass a frozenset, which is reused as the cache key without copying.
+    """
     try:
         # Get relative path from project root
         rel_path = file_path.relative_to(project_root)
-        rel_path_str = str(rel_path)
 
         # Check if file is in any parent directory that should be ignored
-        for part in rel_path.parts:
-            if part in ALWAYS_IGNORED_DIRS:
-                return True
-
-        for pattern in gitignore_patterns:
-            # Handle directory patterns (ending with /)
-            if pattern.endswith("/"):
-                if fnmatch.fnmatch(rel_path_str + "/", pattern) or fnmatch.fnmatch(rel_path_str, pattern[:-1]):
-                    return True
-            # Handle file patterns
-            elif fnmatch.fnmatch(rel_path_str, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-                return True
+        if not ALWAYS_IGNORED_DIRS.isdisjoint(rel_path.parts):
+            return True
 
-        return False
+        # Directory patterns (ending with /) match the relative path, file patterns
+        # match either the relative path or the file name
+        matchers = _compile_gitignore_patterns(frozenset(gitignore_patterns))
+        return _is_ignored_entry(str(rel_path), file_path.name, *matchers)
     except ValueError:
         # File is not relative to project root
         return False
 
 
-def discover_files(path: Path) -> set[str]:
-    """Discover all files in the given path (recursive), respecting .gitignore."""
-    files = set()
+def _walk_project(path: Path) -> Iterator[os.DirEntry[str]]:
+    """Walk the project tree once, respecting .gitignore.
+
+    Ignored directories are pruned during the walk rather than filtered afterwards,
+    so trees like node_modules or .venv are never descended into.
 
+    Args:
+        path: Path to project directory
+
+    Yields:
+        os.DirEntry for every non-ignored file; its name, path and cached type
+        information avoid building Path objects per file
+    """
     # Read gitignore patterns
     gitignore_patterns = read_gitignore_patterns(path)
 
@@ -253,21 +470,76 @@ def discover_files(path: Path) -> set[str]:
     if len(gitignore_patterns) <= 2:  # Only .git patterns added
         gitignore_patterns.update(DEFAULT_GITIGNORE_PATTERNS)
 
-    for file_path in path.rglob("*"):
-        if file_path.is_file():
-            # Skip if ignored by gitignore patterns
-            if not is_ignored_by_gitignore(file_path, path, gitignore_patterns):
-                files.add(file_path.name.lower())
-                # Also add file extensions
-                if file_path.suffix:
-                    files.add(file_path.suffix.lower())
+    matchers = _compile_gitignore_patterns(frozenset(gitignore_patterns))
+
+    # Stack of (relative prefix, absolute directory) pairs
+    stack = [("", str(path))]
+    while stack:
+        rel_dir, abs_dir = stack.pop()
+        try:
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    rel_path = rel_dir + name
+
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in ALWAYS_IGNORED_DIRS and not _is_ignored_entry(rel_path, name, *matchers):
+                            stack.append((rel_path + "/", entry.path))
+                    elif entry.is_file() and not _is_ignored_entry(rel_path, name, *matchers):
+                        yield entry
+        except OSError:
+            # Unreadable directory, skip it like rglob does
+            continue
+
+
+def _file_suffix(name: str) -> str:
+    """Return the extension of a file name, following the same rules as Path.suffix."""
+    dot = name.rfind(".")
+    return name[dot:] if 0 < dot < len(name) - 1 else ""
+
+
+def discover_files(path: Path) -> set[str]:
+    """Discover all files in the given path (recursive), respecting .gitignore."""
+    files = set()
+
+    for entry in _walk_project(path):
+        name = entry.name.lower()
+        files.add(name)
+        # Also add file extensions
+        suffix = _file_suffix(name)
+        if suffix:
+            files.add(suffix)
 
     return files
 
 
+def _scan_project(path: Path) -> int:
+    """Stream the project walk into a category bitmask.
+
+    Nothing is accumulated per file, so memory stays bounded on huge trees, and the
+    walk stops as soon as every category has been detected.
+
+    Args:
+        path: Path to project directory
+
+    Returns:
+        Bitmask of detected categories
+    """
+    mask = 0
+
+    for entry in _walk_project(path):
+        name = entry.name.lower()
+        mask |= INDICATOR_BITS.get(name, 0) | INDICATOR_BITS.get(_file_suffix(name), 0)
+
+        if mask == ALL_INDICATOR_BITS:
+            break
+
+    return mask
+
+
 def detect_python(files: set[str]) -> bool:
     """Detect if this is a Python project."""
-    return bool(PYTHON_INDICATORS & files)
+    return not PYTHON_INDICATORS.isdisjoint(files)
 
 
 def detect_uv_lock(files: set[str]) -> bool:
@@ -277,42 +549,52 @@ def detect_uv_lock(files: set[str]) -> bool:
 
 def detect_javascript(files: set[str]) -> bool:
     """Detect if this is a JavaScript project."""
-    return bool(JAVASCRIPT_INDICATORS & files)
+    return not JAVASCRIPT_INDICATORS.isdisjoint(files)
 
 
 def detect_typescript(files: set[str]) -> bool:
     """Detect if project uses TypeScript."""
-    return bool(TYPESCRIPT_INDICATORS & files)
+    return not TYPESCRIPT_INDICATORS.isdisjoint(files)
 
 
 def detect_jsx(files: set[str]) -> bool:
     """Detect if project uses JSX/React."""
-    return bool(JSX_INDICATORS & files)
+    return not JSX_INDICATORS.isdisjoint(files)
 
 
 def detect_go(files: set[str]) -> bool:
     """Detect if this is a Go project."""
-    return bool(GO_INDICATORS & files)
+    return not GO_INDICATORS.isdisjoint(files)
 
 
 def detect_docker(files: set[str]) -> bool:
     """Detect if project uses Docker."""
-    return bool(DOCKER_INDICATORS & files)
+    return not DOCKER_INDICATORS.isdisjoint(files)
 
 
 def detect_github_actions(files: set[str], path: Path) -> bool:
-    """Detect if project uses GitHub Actions."""
-    # Check for .github/workflows directory
+    """Detect if project uses GitHub Actions.
+
+    ``files`` is accepted for symmetry with the other detectors; only the
+    workflows directory is inspected.
+    """
+    return _has_github_workflows(path)
+
+
+def _has_github_workflows(path: Path) -> bool:
+    """Check for a workflow file in .github/workflows, stopping at the first one found."""
     github_workflows = path / ".github" / "workflows"
-    if github_workflows.exists() and github_workflows.is_dir():
-        workflow_files = list(github_workflows.glob("*.yml")) + list(github_workflows.glob("*.yaml"))
-        return len(workflow_files) > 0
-    return False
+    try:
+        with os.scandir(github_workflows) as entries:
+            return any(entry.name.endswith((".yml", ".yaml")) and entry.is_file() for entry in entries)
+    except OSError:
+        # Missing directory, not a directory, or unreadable
+        return False
 
 
-def has_file_type(files: set[str], indicators: set[str]) -> bool:
+def has_file_type(files: set[str], indicators: frozenset[str]) -> bool:
     """Check if project has files matching any of the given indicators."""
-    return bool(indicators & files)
+    return not indicators.isdisjoint(files)
 
 
 def detect_yaml_files(files: set[str]) -> bool:
@@ -335,84 +617,80 @@ def detect_xml_files(files: set[str]) -> bool:
     return has_file_type(files, XML_FILE_INDICATORS)
 
 
-def detect_python_version(path: Path) -> Optional[str]:
-    """Attempt to detect Python version from project files."""
-    # Check pyproject.toml
-    pyproject_file = path / "pyproject.toml"
-    if pyproject_file.exists() and toml_lib:
-        try:
-            with open(pyproject_file, "rb") as f:
-                data = toml_lib.load(f)
-
-            # Check requires-python
-            project = data.get("project", {})
-            requires_python = project.get("requires-python")
-            if requires_python and isinstance(requires_python, str):
-                # Extract version like ">=3.14" -> "python3.14"
-                if ">=" in requires_python:
-                    version = requires_python.split(">=")[1].strip()
-                    return f"python{version}"
-        except (OSError, ValueError, KeyError):
-            # OSError: file reading issues
-            # ValueError: TOML parsing errors
-            # KeyError: unexpected structure
-            pass
+def detect_python_version(path: Path, pyproject_data: Optional[dict] = None) -> Optional[str]:
+    """Attempt to detect Python version from project files.
+
+    The cheap .python-version file is checked first, so pyproject.toml is only
+    parsed when it is actually needed.
 
+    Args:
+        path: Path to project directory
+        pyproject_data: Already-parsed pyproject.toml (read from disk if None)
+    """
     # Check .python-version file
     python_version_file = path / ".python-version"
-    if python_version_file.exists():
-        try:
-            version = python_version_file.read_text().strip()
-            if version and not version.startswith("python"):
-                return f"python{version}"
-            return version if version else None
-        except (OSError, UnicodeDecodeError):
-            # OSError: file reading issues
-            # UnicodeDecodeError: binary or encoding issues
-            pass
+    try:
+        version = python_version_file.read_bytes().decode("utf-8").strip()
+        if version:
+            return version if version.startswith("python") else f"python{version}"
+    except (OSError, UnicodeDecodeError):
+        # OSError: missing file or file reading issues
+        # UnicodeDecodeError: binary or encoding issues
+        pass
+
+    # Check pyproject.toml
+    if pyproject_data is None:
+        pyproject_data = _load_pyproject(path)
+    if pyproject_data:
+        project = pyproject_data.get("project", {})
+        requires_python = project.get("requires-python") if isinstance(project, dict) else None
+        if requires_python and isinstance(requires_python, str):
+            # Extract version like ">=3.14" or ">= 3.10, <4" -> "python3.14" / "python3.10"
+            match = REQUIRES_PYTHON_RE.search(requires_python)
+            if match:
+                return f"python{match.group(1)}"
 
     return None
 
 
-def find_config_file(files: set[str], configs: list[str]) -> Optional[str]:
-    """Find the first matching config file from a list."""
-    for config in configs:
-        if config.lower() in files:
-            return config
-    return None
+def _root_file_names(path: Path) -> frozenset[str]:
+    """List the regular files in the project root with a single directory read."""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        # Missing or unreadable project root
+        return frozenset()
+
+
+def _preferred_config(root_files: frozenset[str], priority: dict[str, int]) -> Optional[str]:
+    """Pick the highest-priority candidate present in the project root."""
+    hits = root_files.intersection(priority)
+    return min(hits, key=priority.__getitem__) if hits else None
+
 
+def find_config_files(path: Path, root_files: Optional[frozenset[str]] = None) -> dict:
+    """Find configuration files for various tools.
 
-def find_config_files(path: Path, files: set[str]) -> dict:
-    """Find configuration files for various tools."""
+    Reads the project root once and intersects it with each tool's candidates, so no
+    prior walk is needed. Configs are passed to hooks as root-relative paths, so only
+    root files qualify.
+
+    Args:
+        path: Path to project directory
+        root_files: Names of the regular files in the project root (listed if None)
+    """
     config_files = {}
+    if root_files is None:
+        root_files = _root_file_names(path)
 
     # Prettier configs
-    prettier_config = find_config_file(
-        files,
-        [
-            ".prettierrc",
-            ".prettierrc.json",
-            ".prettierrc.yml",
-            ".prettierrc.yaml",
-            ".prettierrc.js",
-            "prettier.config.js",
-        ],
-    )
+    prettier_config = _preferred_config(root_files, PRETTIER_CONFIG_PRIORITY)
     if prettier_config:
         config_files["prettier_config"] = prettier_config
 
     # ESLint configs
-    eslint_config = find_config_file(
-        files,
-        [
-            ".eslintrc",
-            ".eslintrc.json",
-            ".eslintrc.yml",
-            ".eslintrc.yaml",
-            ".eslintrc.js",
-            "eslint.config.js",
-        ],
-    )
+    eslint_config = _preferred_config(root_files, ESLINT_CONFIG_PRIORITY)
     if eslint_config:
         config_files["eslint_config"] = eslint_config
 
@@ -421,31 +699,38 @@ def find_config_files(path: Path, files: set[str]) -> dict:
 
 def discover_config(path: Path) -> PreCommitConfig:
     """Discover project configuration by analyzing files."""
-    files = discover_files(path)
+    mask = _scan_project(path)
 
     # Detect technologies
-    has_python = detect_python(files)
-    has_js = detect_javascript(files)
-    has_typescript = detect_typescript(files)
-    has_jsx = detect_jsx(files)
-    has_go = detect_go(files)
-    has_docker = detect_docker(files)
-    has_github_actions = detect_github_actions(files, path)
+    has_python = bool(mask & PYTHON_BIT)
+    has_js = bool(mask & JAVASCRIPT_BIT)
+    has_typescript = bool(mask & TYPESCRIPT_BIT)
+    has_jsx = bool(mask & JSX_BIT)
+    has_go = bool(mask & GO_BIT)
+    has_docker = bool(mask & DOCKER_BIT)
+    has_github_actions = _has_github_workflows(path)
 
     # Detect file types
-    has_yaml = detect_yaml_files(files)
-    has_json = detect_json_files(files)
-    has_toml = detect_toml_files(files)
-    has_xml = detect_xml_files(files)
+    has_yaml = bool(mask & YAML_FILE_BIT)
+    has_json = bool(mask & JSON_FILE_BIT)
+    has_toml = bool(mask & TOML_FILE_BIT)
+    has_xml = bool(mask & XML_FILE_BIT)
+
+    # List the project root once for the probes below
+    root_files = _root_file_names(path)
 
-    # Detect Python version
-    python_version = detect_python_version(path) if has_python else None
+    # Detect Python version (pyproject.toml is only parsed if .python-version is absent)
+    python_version = None
+    if has_python and not root_files.isdisjoint(PYTHON_VERSION_FILES):
+        python_version = detect_python_version(path)
 
     # Find config files
-    config_files = find_config_files(path, files)
+    config_files = find_config_files(path, root_files)
 
-    # Build configuration
-    config = PreCommitConfig(
+    # Build configuration. Every value is produced above with the right type, and
+    # detect_python_version() always returns a "python"-prefixed version, so skip
+    # pydantic validation here; user-edited configs are still validated in main.py.
+    config = PreCommitConfig.model_construct(
         python_version=python_version,
         yaml=has_yaml,
         json=has_json,
@@ -455,7 +740,7 @@ def discover_config(path: Path) -> PreCommitConfig:
         executables=True,  # Always enable for shell script safety
         python=has_python,
         python_base=has_python,  # Include Python base checks if Python detected
-        uv_lock=detect_uv_lock(files),  # Use uv lock if uv.lock file exists
+        uv_lock=bool(mask & UV_LOCK_BIT),  # Use uv lock if uv.lock file exists
         js=has_js,
         typescript=has_typescript,
         jsx=has_jsx,
@@ -5,6 +5,13 @@ from typing import Optional
 
 import yaml
 
+try:
+    # libyaml-backed loader, an order of magnitude faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 # Default Python version for workflows when not detected
 DEFAULT_PYTHON_VERSION = "3.11"
 
@@ -20,7 +27,7 @@ def parse_precommit_config(config_path: Path) -> dict:
     """
     try:
         with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
     except (OSError, UnicodeDecodeError, yaml.YAMLError):
         # Return default if file can't be read or parsed
         return {"python_version": DEFAULT_PYTHON_VERSION}
@@ -1,34 +1,37 @@
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, PackageLoader
 
 from pre_commit_tools.config import PreCommitConfig
 
 # Package version - update this when version changes
 __version__ = "0.1.1"
 
-# Initialize Jinja2 environment once at module level
-TEMPLATES_DIR = Path(__file__).parent
-JINJA_ENV = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+# Initialize Jinja2 environment once at module level. Templates are loaded as package
+# resources so they also resolve from zipped or frozen installs, and since they never
+# change at runtime, skip the per-lookup mtime check and never evict.
+JINJA_ENV = Environment(
+    loader=PackageLoader("pre_commit_tools", "hook_templates"),
+    auto_reload=False,
+    cache_size=-1,
+)
+
+TEMPLATE_MAPPING = {
+    "base": "base.j2",
+    "python": "python.j2",
+    "docker": "docker.j2",
+    "js": "js.j2",
+    "go": "go.j2",
+    "github_actions": "github_actions.j2",
+}
 
 
 def _generate_hooks(hook_type: str, **kwargs: Any) -> str:
-    template_mapping = {
-        "base": "base.j2",
-        "python": "python.j2",
-        "docker": "docker.j2",
-        "js": "js.j2",
-        "go": "go.j2",
-        "github_actions": "github_actions.j2",
-    }
-
-    if hook_type not in template_mapping:
+    if hook_type not in TEMPLATE_MAPPING:
         raise ValueError(f"Unsupported hook type: {hook_type}")
 
-    template = JINJA_ENV.get_template(template_mapping[hook_type])
-    return template.render(**kwargs)
+    return JINJA_ENV.get_template(TEMPLATE_MAPPING[hook_type]).render(**kwargs)
 
 
 def _generate_meta_wrapper(
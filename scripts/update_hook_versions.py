@@ -18,7 +18,7 @@ import subprocess
 import sys
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     import yaml
@@ -28,6 +28,23 @@ except ImportError as e:
     print("Install with: uv pip install pyyaml jinja2")
     sys.exit(1)
 
+try:
+    # libyaml-backed loader, an order of magnitude faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Maximum number of repositories pre-commit autoupdate checks concurrently
+AUTOUPDATE_JOBS = 8
+
+# Repository URL and revision of a hook in a template.
+# Handles various revision formats: v1.2.3, 1.2.3, v1.2.3-alpha, etc.
+REPO_REV_RE = re.compile(r"- repo: (https://github\.com/[^\n]+)\n\s+rev: ([^\s\n]+)")
+
+# A version change reported by pre-commit autoupdate
+AUTOUPDATE_RE = re.compile(r"\[(https://github\.com/[^\]]+)\] updating ([^\s]+) -> ([^\s]+)")
+
 
 class TemplateUpdater:
     """Handles updating pre-commit hook versions in template files."""
@@ -38,29 +55,28 @@ class TemplateUpdater:
         self.temp_dir: Optional[Path] = None
         self.original_revisions: Dict[str, str] = {}
         self.updated_hooks: List[Dict[str, str]] = []
+        # Template text read by extract_original_revisions, reused when applying updates
+        self.template_contents: Dict[Path, str] = {}
+        # Templates that use each repository, so updates only touch those templates
+        self.repo_templates: Dict[str, List[Path]] = {}
+        # Repositories in the generated config, set by generate_full_config
+        self.repos: Optional[List[Dict[str, Any]]] = None
+        # Absolute path to pre-commit, resolved once; None when it is not installed
+        self.precommit_path = shutil.which("pre-commit")
 
         if not self.template_dir.exists():
             raise FileNotFoundError(f"Template directory not found: {self.template_dir}")
 
+        self.env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+
     def setup_temp_directory(self) -> Path:
         """Create a temporary directory for the update process."""
         self.temp_dir = Path(tempfile.mkdtemp(prefix="pre-commit-update-"))
 
         # Initialize git repo (required by pre-commit)
         try:
+            # pre-commit autoupdate never commits, so no user identity is needed
             subprocess.run(["git", "init"], cwd=str(self.temp_dir), capture_output=True, check=True)
-            subprocess.run(
-                ["git", "config", "user.email", "test@example.com"],
-                cwd=str(self.temp_dir),
-                capture_output=True,
-                check=True,
-            )
-            subprocess.run(
-                ["git", "config", "user.name", "Test User"],
-                cwd=str(self.temp_dir),
-                capture_output=True,
-                check=True,
-            )
         except subprocess.CalledProcessError as e:
             print(f"WARNING: Failed to initialize git repo: {e}")
 
@@ -74,20 +90,22 @@ class TemplateUpdater:
     def extract_original_revisions(self) -> Dict[str, str]:
         """Extract current hook revisions from all template files."""
         revisions = {}
+        repo_templates: Dict[str, List[Path]] = {}
 
         for template_file in self.template_dir.glob("*.j2"):
             if template_file.name == "meta.j2":
                 continue
 
             content = template_file.read_text()
-            # Handles various revision formats: v1.2.3, 1.2.3, v1.2.3-alpha, etc.
-            pattern = r"- repo: (https://github\.com/[^\n]+)\n\s+rev: ([^\s\n]+)"
-            matches = re.findall(pattern, content)
+            self.template_contents[template_file] = content
+            matches = REPO_REV_RE.findall(content)
 
             for repo_url, rev in matches:
                 revisions[repo_url] = rev
+                repo_templates.setdefault(repo_url, []).append(template_file)
 
         self.original_revisions = revisions
+        self.repo_templates = repo_templates
         print(f"Found {len(revisions)} hooks in templates")
         return revisions
 
@@ -95,7 +113,6 @@ class TemplateUpdater:
         """Generate a complete .pre-commit-config.yaml from all templates."""
         assert self.temp_dir is not None, "Temp directory must be set up first"
         output_file = self.temp_dir / ".pre-commit-config.yaml"
-        env = Environment(loader=FileSystemLoader(str(self.template_dir)))
 
         context = {
             "yaml": True,
@@ -127,21 +144,21 @@ class TemplateUpdater:
         )
 
         for template_file in template_files:
-            template = env.get_template(template_file.name)
+            template = self.env.get_template(template_file.name)
             content = template.render(context)
             all_content.append(content)  # type: ignore[arg-type]
 
         combined_content = "\n".join(all_content)
-        meta_template = env.get_template("meta.j2")
+        meta_template = self.env.get_template("meta.j2")
         final_config = meta_template.render({**context, "content": combined_content})
 
         output_file.write_text(final_config)
         try:
-            with open(output_file) as f:
-                config = yaml.safe_load(f)
+            # Parse the rendered text directly rather than reading the file back
+            config = yaml.load(final_config, Loader=SafeLoader)
             if config and isinstance(config, dict):
-                repos = config.get("repos", [])
-                print(f"Generated config with {len(repos)} repositories")
+                self.repos = config.get("repos", [])
+                print(f"Generated config with {len(self.repos)} repositories")
         except yaml.YAMLError as e:
             print(f"ERROR: Generated invalid YAML: {e}")
             raise
@@ -150,9 +167,7 @@ class TemplateUpdater:
 
     def run_autoupdate(self) -> tuple[bool, str]:
         """Run pre-commit autoupdate and return success status and stdout."""
-        try:
-            subprocess.run(["pre-commit", "--version"], capture_output=True, text=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if self.precommit_path is None:
             print("ERROR: pre-commit is not installed or not in PATH")
             print("Install with: pip install pre-commit")
             return False, ""
@@ -161,71 +176,60 @@ class TemplateUpdater:
         env["GIT_TERMINAL_PROMPT"] = "0"
         env["GIT_ASKPASS"] = "echo"
 
-        all_updates = []
-
         assert self.temp_dir is not None, "Temp directory must be set up first"
 
-        try:
-            with open(self.temp_dir / ".pre-commit-config.yaml") as f:
-                config = yaml.safe_load(f)
-        except Exception as e:
-            print(f"ERROR: Failed to read config: {e}")
-            return False, ""
-
-        if config is None or not isinstance(config, dict):
-            print("ERROR: Invalid config file")
-            return False, ""
-
-        repos = config.get("repos", [])
-        print(f"Checking {len(repos)} repositories for updates...")
+        # The config was already parsed when it was generated
+        repos = self.repos
+        if repos is None:
+            try:
+                with open(self.temp_dir / ".pre-commit-config.yaml") as f:
+                    config = yaml.load(f, Loader=SafeLoader)
+            except Exception as e:
+                print(f"ERROR: Failed to read config: {e}")
+                return False, ""
 
-        for repo in repos:
-            repo_url = repo.get("repo")
-            if not repo_url:
-                continue
+            if config is None or not isinstance(config, dict):
+                print("ERROR: Invalid config file")
+                return False, ""
 
-            repo_name = repo_url.split("/")[-1]
-            print(f"  {repo_name}...", end=" ", flush=True)
+            repos = config.get("repos", [])
 
-            try:
-                result = subprocess.run(
-                    ["pre-commit", "autoupdate", "--repo", repo_url],
-                    cwd=str(self.temp_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                    env=env,
-                )
+        print(f"Checking {len(repos)} repositories for updates...")
 
-                if result.returncode == 0:
-                    if "updating" in result.stdout:
-                        print("updated")
-                        all_updates.append(result.stdout)  # type: ignore[arg-type]
-                    else:
-                        print("up to date")
-                else:
-                    print("failed")
-
-            except subprocess.TimeoutExpired:
-                print("timeout")
-            except Exception as e:
-                print(f"error: {e}")
+        # A single autoupdate run updates every repository, instead of paying
+        # pre-commit's startup cost once per repository. Fetching revisions is
+        # network-bound, so let pre-commit check several repositories at once.
+        jobs = min(AUTOUPDATE_JOBS, max(len(repos), 1))
+        try:
+            result = subprocess.run(
+                [self.precommit_path, "autoupdate", "--jobs", str(jobs)],
+                cwd=str(self.temp_dir),
+                capture_output=True,
+                text=True,
+                timeout=60 * max(len(repos), 1),
+                env=env,
+            )
+        except subprocess.TimeoutExpired:
+            print("ERROR: pre-commit autoupdate timed out")
+            return False, ""
 
-        combined_output = "\n".join(all_updates)
+        if result.returncode != 0:
+            # Repositories that could not be updated are reported, the rest are still updated
+            print("WARNING: Some repositories could not be updated:")
+            print(result.stderr or result.stdout)
 
-        if not combined_output:
+        if "updating" not in result.stdout:
             print("No updates found")
             return True, ""
 
-        return True, combined_output
+        return True, result.stdout
 
     def parse_autoupdate_output(self, autoupdate_stdout: str) -> List[Dict[str, str]]:
         """Parse pre-commit autoupdate stdout to extract version changes."""
         updated_hooks = []
-        pattern = r"\[(https://github\.com/[^\]]+)\] updating ([^\s]+) -> ([^\s]+)"
 
         for line in autoupdate_stdout.splitlines():
-            match = re.search(pattern, line)
+            match = AUTOUPDATE_RE.search(line)
             if match:
                 repo_url = match.group(1)
                 old_rev = match.group(2)
@@ -241,25 +245,43 @@ class TemplateUpdater:
             return {}
 
         updates_per_file = {}
+        # Keyed on repository and old revision, so a revision shared by two
+        # repositories in one template is only updated for the right one
+        new_revisions = {(hook["repo"], hook["old_rev"]): hook["new_rev"] for hook in self.updated_hooks}
+
+        if self.repo_templates:
+            template_files = list(
+                dict.fromkeys(
+                    template_file
+                    for hook in self.updated_hooks
+                    for template_file in self.repo_templates.get(hook["repo"], [])
+                )
+            )
+        else:
+            template_files = [f for f in self.template_dir.glob("*.j2") if f.name != "meta.j2"]
 
-        for template_file in self.template_dir.glob("*.j2"):
-            if template_file.name == "meta.j2":
-                continue
-
-            content = template_file.read_text()
+        for template_file in template_files:
+            content = self.template_contents.get(template_file)
+            if content is None:
+                content = template_file.read_text()
             updates_made = 0
 
-            for hook in self.updated_hooks:
-                if hook["repo"] in content:
-                    old_pattern = f"rev: {hook['old_rev']}"
-                    new_pattern = f"rev: {hook['new_rev']}"
-
-                    if old_pattern in content:
-                        content = content.replace(old_pattern, new_pattern)
-                        updates_made += 1
+            # Rewrite every matching revision in a single scan of the template
+            parts = []
+            last_end = 0
+            for match in REPO_REV_RE.finditer(content):
+                new_rev = new_revisions.get((match[1], match[2]))
+                if new_rev is not None:
+                    parts.append(content[last_end : match.start(2)])
+                    parts.append(new_rev)
+                    last_end = match.end(2)
+                    updates_made += 1
 
             if updates_made > 0:
+                parts.append(content[last_end:])
+                content = "".join(parts)
                 template_file.write_text(content)
+                self.template_contents[template_file] = content
                 updates_per_file[template_file.name] = updates_made
 
         return updates_per_file
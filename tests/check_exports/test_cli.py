@@ -1,5 +1,6 @@
 """Tests for CLI module."""
 
+import json
 import sys
 from unittest.mock import patch
 
@@ -76,3 +77,48 @@ from lib2 import func2
 
         with patch.object(sys, "argv", ["check-exports", str(lib1_dir), str(lib2_dir)]):
             assert main() == 0
+
+    def test_json_output_is_compact(self, temp_codebase, capsys):
+        """Test that --json prints violations as a single compact JSON document."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("__all__ = []")
+        (lib_dir / "core.py").write_text("def _private(): pass")
+        (temp_codebase / "app.py").write_text("from mylib.core import _private")
+
+        with patch.object(sys, "argv", ["check-exports", "--json", str(lib_dir)]):
+            assert main() == 1
+
+        first_line = capsys.readouterr().out.splitlines()[0]
+        output = json.loads(first_line)
+        assert output["count"] == 1
+        assert output["violations"][0]["func_name"] == "core._private"
+        assert ", " not in first_line
+
+    def test_no_cache_flag_skips_cache_directory(self, temp_codebase):
+        """Test that --no-cache leaves no scan cache in the source tree."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+        (temp_codebase / "app.py").write_text("from mylib import func")
+
+        with patch.object(sys, "argv", ["check-exports", "--no-cache", str(lib_dir)]):
+            assert main() == 0
+        assert not (temp_codebase / ".check-exports-cache").exists()
+
+        with patch.object(sys, "argv", ["check-exports", str(lib_dir)]):
+            assert main() == 0
+        assert (temp_codebase / ".check-exports-cache").is_dir()
+
+    def test_no_cache_config_key(self, temp_codebase):
+        """Test that no_cache in the config file disables the scan cache."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+        (temp_codebase / "app.py").write_text("from mylib import func")
+        config_file = temp_codebase / "config.toml"
+        config_file.write_text(f'[tool.check-exports]\nlibraries = ["{lib_dir.as_posix()}"]\nno_cache = true\n')
+
+        with patch.object(sys, "argv", ["check-exports", "--config", str(config_file)]):
+            assert main() == 0
+        assert not (temp_codebase / ".check-exports-cache").exists()
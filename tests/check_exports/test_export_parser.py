@@ -62,6 +62,30 @@ from lib.core import process as public_process
         assert "public_helper" in exported
         assert "public_process" in exported
 
+    def test_extract_from_nested_blocks(self, temp_codebase):
+        """Test that exports inside try/except and if blocks are found."""
+        lib_dir = temp_codebase / "lib"
+        lib_dir.mkdir()
+
+        (lib_dir / "__init__.py").write_text(
+            """
+try:
+    from lib.fast import speedup
+except ImportError:
+    from lib.slow import speedup as fallback
+
+if True:
+    __all__ = ["speedup", "listed_only"]
+
+def outer():
+    def inner():
+        pass
+"""
+        )
+
+        exported = get_exported_functions(lib_dir / "__init__.py")
+        assert exported == {"speedup", "fallback", "listed_only", "outer", "inner"}
+
     def test_empty_init(self, temp_codebase):
         """Test handling of empty __init__.py."""
         lib_dir = temp_codebase / "lib"
@@ -89,6 +113,24 @@ from lib.core import process as public_process
         exported = get_exported_functions(lib_dir / "__init__.py")
         assert len(exported) == 0
 
+    def test_undecodable_init(self, temp_codebase):
+        """Test that an __init__.py with invalid encoding is treated as exporting nothing."""
+        lib_dir = temp_codebase / "lib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_bytes(b"def func(): pass\nx = '\xff\xfe'\n")
+
+        exported = get_exported_functions(lib_dir / "__init__.py")
+        assert exported == set()
+
+    def test_latin1_declared_init(self, temp_codebase):
+        """Test that a PEP 263 encoding declaration is honoured."""
+        lib_dir = temp_codebase / "lib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_bytes(b"# -*- coding: latin-1 -*-\ndef func(): return '\xe9'\n")
+
+        exported = get_exported_functions(lib_dir / "__init__.py")
+        assert exported == {"func"}
+
 
 class TestGetLibraryRoot:
     """Test library root path resolution."""
@@ -1,6 +1,11 @@
 """Tests for import_detector module."""
 
-from pre_commit_tools.check_exports.import_detector import find_imports_via_ast
+import concurrent.futures
+import os
+
+from pre_commit_tools.check_exports import import_detector
+from pre_commit_tools.check_exports.cache import get_cache_file
+from pre_commit_tools.check_exports.import_detector import find_imports_for_libraries, find_imports_via_ast
 
 
 class TestFindImportsViaAST:
@@ -96,3 +101,275 @@ class TestFindImportsViaAST:
 
         # Should still find the import in app.py despite broken.py
         assert "mylib.func" in imports
+
+    def test_files_without_library_name_are_not_parsed(self, temp_codebase, monkeypatch):
+        """Test that files never mentioning the library skip AST parsing."""
+        import ast
+
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+
+        external_dir = temp_codebase / "external"
+        external_dir.mkdir()
+        (external_dir / "app.py").write_text("from mylib import func")
+        (external_dir / "other.py").write_text("import os\nimport sys")
+        (external_dir / "similar.py").write_text("import mylibrary\nfrom mylib_extra import x")
+
+        parsed = []
+        real_parse = ast.parse
+
+        def tracking_parse(source, *args, **kwargs):
+            parsed.append(source)
+            return real_parse(source, *args, **kwargs)
+
+        monkeypatch.setattr(ast, "parse", tracking_parse)
+
+        imports = find_imports_via_ast(lib_dir)
+
+        assert "mylib.func" in imports
+        assert parsed == [b"from mylib import func"]
+
+    def test_undecodable_files_skipped(self, temp_codebase):
+        """Test that files with invalid encoding are skipped gracefully."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+
+        external_dir = temp_codebase / "external"
+        external_dir.mkdir()
+        (external_dir / "app.py").write_text("from mylib import func")
+        (external_dir / "binary.py").write_bytes(b"from mylib import func\nx = '\xff\xfe'\n")
+
+        imports = find_imports_via_ast(lib_dir)
+
+        assert len(imports["mylib.func"]) == 1
+
+    def test_parallel_parsing_matches_serial(self, temp_codebase, monkeypatch):
+        """Test that parsing across processes gives the same results as parsing in-process."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+
+        external_dir = temp_codebase / "external"
+        external_dir.mkdir()
+        for i in range(6):
+            (external_dir / f"app{i}.py").write_text(
+                f"import os\nfrom mylib.sub import helper{i % 2}\nimport mylib.func\n"
+            )
+        (external_dir / "broken.py").write_text("from mylib import (")
+
+        serial = find_imports_via_ast(lib_dir, use_cache=False)
+        monkeypatch.setattr(import_detector, "PARALLEL_PARSE_MIN_FILES", 2)
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        parallel = find_imports_via_ast(lib_dir, use_cache=False)
+
+        assert parallel == serial
+        assert len(parallel["mylib.sub.helper0"]) == 3
+        assert len(parallel["mylib.func"]) == 6
+
+    def test_single_cpu_parses_in_process(self, temp_codebase, monkeypatch):
+        """Test that no process pool is started when only one CPU is available."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+        for i in range(4):
+            (temp_codebase / f"app{i}.py").write_text("from mylib import func\n")
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("a single CPU must not start a process pool")
+
+        monkeypatch.setattr(import_detector, "PARALLEL_PARSE_MIN_FILES", 2)
+        monkeypatch.setattr(os, "cpu_count", lambda: 1)
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+
+        imports = find_imports_via_ast(lib_dir, use_cache=False)
+
+        assert len(imports["mylib.func"]) == 4
+
+    def test_find_imports_in_nested_blocks(self, temp_codebase):
+        """Test that imports inside functions, classes and try/match blocks are found."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+
+        (temp_codebase / "app.py").write_text(
+            """
+def load():
+    from mylib import lazy
+
+class Plugin:
+    try:
+        from mylib.sub import optional
+    except ImportError:
+        from mylib import fallback
+
+match 1:
+    case 1:
+        import mylib.matched
+"""
+        )
+
+        imports = find_imports_via_ast(lib_dir)
+
+        assert set(imports) == {"mylib.lazy", "mylib.sub.optional", "mylib.fallback", "mylib.matched"}
+        assert imports["mylib.lazy"][0][1] == 3
+
+    def test_unchanged_files_are_served_from_cache(self, temp_codebase, monkeypatch):
+        """Test that a second scan reuses cached results and only re-parses changed files."""
+        import ast
+
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+        (temp_codebase / "app.py").write_text("from mylib import func")
+        (temp_codebase / "other.py").write_text("from mylib import other")
+
+        first = find_imports_via_ast(lib_dir)
+        assert (temp_codebase / ".check-exports-cache" / ".gitignore").exists()
+
+        parsed = []
+        real_parse = ast.parse
+
+        def tracking_parse(source, *args, **kwargs):
+            parsed.append(source)
+            return real_parse(source, *args, **kwargs)
+
+        monkeypatch.setattr(ast, "parse", tracking_parse)
+
+        assert find_imports_via_ast(lib_dir) == first
+        assert parsed == []
+
+        app = temp_codebase / "app.py"
+        app.write_text("\nfrom mylib import func, extra")
+        os.utime(app, ns=(0, app.stat().st_mtime_ns + 1_000_000))
+
+        imports = find_imports_via_ast(lib_dir)
+        assert parsed == [b"\nfrom mylib import func, extra"]
+        assert imports["mylib.func"] == [(str(app), 2)]
+        assert imports["mylib.other"] == first["mylib.other"]
+
+    def test_corrupt_cache_is_ignored(self, temp_codebase):
+        """Test that an unreadable cache file falls back to a full scan."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+        (temp_codebase / "app.py").write_text("from mylib import func")
+
+        cache_file = get_cache_file(temp_codebase, ["mylib"])
+        cache_file.parent.mkdir()
+        cache_file.write_text("{not json")
+
+        imports = find_imports_via_ast(lib_dir)
+
+        assert imports == {"mylib.func": [(str(temp_codebase / "app.py"), 1)]}
+
+    def test_ignored_and_excluded_directories_are_not_walked(self, temp_codebase, monkeypatch):
+        """Test that virtualenvs, build output and excluded directories are pruned from the walk."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+
+        for dir_name in [".venv", "build", "tests", "src"]:
+            (temp_codebase / dir_name / "pkg").mkdir(parents=True)
+            (temp_codebase / dir_name / "pkg" / "app.py").write_text("from mylib import func")
+
+        scanned = []
+        real_scandir = os.scandir
+
+        def tracking_scandir(path):
+            scanned.append(os.path.relpath(path, temp_codebase))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", tracking_scandir)
+
+        imports = find_imports_via_ast(lib_dir, use_cache=False, exclude_patterns=["*/tests/*"])
+
+        assert imports == {"mylib.func": [(str(temp_codebase / "src" / "pkg" / "app.py"), 1)]}
+        assert sorted(scanned) == [".", "src", os.path.join("src", "pkg")]
+
+    def test_package_named_env_is_scanned(self, temp_codebase):
+        """Test that only known virtualenv names are pruned, not any directory called env."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+
+        (temp_codebase / "env").mkdir()
+        (temp_codebase / "env" / "settings.py").write_text("from mylib import func")
+
+        imports = find_imports_via_ast(lib_dir, use_cache=False)
+
+        assert imports == {"mylib.func": [(str(temp_codebase / "env" / "settings.py"), 1)]}
+
+    def test_libraries_sharing_a_prefix_are_not_matched(self, temp_codebase):
+        """Test that imports from a library whose name merely starts with lib_name are ignored."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("def func(): pass")
+
+        (temp_codebase / "app.py").write_text(
+            "import mylibrary.helpers\nfrom mylibrary import other\nfrom mylib import func\n"
+        )
+
+        imports = find_imports_via_ast(lib_dir)
+
+        assert set(imports) == {"mylib.func"}
+
+    def test_sibling_libraries_share_one_parse(self, temp_codebase, monkeypatch):
+        """Test that sibling libraries are scanned together, matching separate scans."""
+        for lib_name in ["liba", "libb"]:
+            lib_dir = temp_codebase / lib_name
+            lib_dir.mkdir()
+            (lib_dir / "__init__.py").write_text("def func(): pass")
+        (temp_codebase / "liba" / "core.py").write_text("from liba import func\nfrom libb import func\n")
+        (temp_codebase / "app.py").write_text("from liba import func\nimport libb.core\n")
+
+        lib_roots = [temp_codebase / "liba", temp_codebase / "libb"]
+        separate = {lib_root: find_imports_via_ast(lib_root, use_cache=False) for lib_root in lib_roots}
+
+        parsed = []
+        real_collect = import_detector._collect_imports
+
+        def counting_collect(source, lib_names):
+            parsed.append(source)
+            return real_collect(source, lib_names)
+
+        monkeypatch.setattr(import_detector, "_collect_imports", counting_collect)
+
+        shared = find_imports_for_libraries(lib_roots, use_cache=False)
+
+        assert shared == separate
+        assert shared[lib_roots[1]] == {
+            "libb.func": [(str(temp_codebase / "liba" / "core.py"), 2)],
+            "libb.core": [(str(temp_codebase / "app.py"), 2)],
+        }
+        # app.py and liba/core.py each parsed once; the __init__ files mention neither library
+        assert len(parsed) == 2
+
+    def test_cache_for_many_long_library_names(self, temp_codebase, monkeypatch):
+        """Test that libraries whose joined names exceed a file name limit are still cached."""
+        lib_roots = []
+        for index in range(20):
+            lib_dir = temp_codebase / f"library_with_a_rather_long_name_{index:02d}"
+            lib_dir.mkdir()
+            (lib_dir / "__init__.py").write_text("def func(): pass")
+            lib_roots.append(lib_dir)
+        (temp_codebase / "app.py").write_text(f"from {lib_roots[0].name} import func\n")
+
+        first = find_imports_for_libraries(lib_roots)
+
+        cache_files = list((temp_codebase / ".check-exports-cache").glob("imports-*.json"))
+        assert cache_files == [get_cache_file(temp_codebase, [lib_root.name for lib_root in lib_roots])]
+        assert len(cache_files[0].name) < 255
+
+        parsed = []
+        real_collect = import_detector._collect_imports
+
+        def counting_collect(source, lib_names):
+            parsed.append(source)
+            return real_collect(source, lib_names)
+
+        monkeypatch.setattr(import_detector, "_collect_imports", counting_collect)
+
+        assert find_imports_for_libraries(lib_roots) == first
+        assert parsed == []
@@ -60,6 +60,23 @@ def test_public_submodules(tmp_path):
     assert len(violations) == 0
 
 
+def test_public_submodules_match_whole_names(tmp_path):
+    """Test that a public submodule does not cover modules that merely share its prefix."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    lib = repo / "mylib"
+    lib.mkdir()
+    (lib / "__init__.py").write_text("")
+    (lib / "sub.py").write_text("def foo(): pass")
+    (lib / "subtle.py").write_text("def bar(): pass")
+
+    (repo / "app.py").write_text("import mylib.sub\nfrom mylib.sub import foo\nfrom mylib.subtle import bar")
+
+    violations, _ = validate_library(str(lib), public_submodules=["sub"])
+
+    assert [v.func_name for v in violations] == ["subtle.bar"]
+
+
 def test_auto_suggestion(tmp_path):
     """Test auto-suggestion for missing exports."""
     repo = tmp_path / "repo"
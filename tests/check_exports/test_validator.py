@@ -1,5 +1,10 @@
 """Tests for validator module."""
 
+import concurrent.futures
+from pathlib import Path
+
+from pre_commit_tools.check_exports import validator
+
 from pre_commit_tools.check_exports.validator import (
     validate_library,
     validate_libraries,
@@ -117,6 +122,48 @@ from mylib.core import _func_a, _func_b
         violations, stats = validate_library(str(lib_dir))
         assert len(violations) == 2
 
+    def test_sibling_directory_with_library_prefix_is_external(self, temp_codebase):
+        """Test that a sibling directory whose name starts with the library name is not internal."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("")
+        (lib_dir / "core.py").write_text("def _hidden(): pass")
+
+        (temp_codebase / "mylib_ext").mkdir()
+        (temp_codebase / "mylib_ext" / "app.py").write_text("from mylib.core import _hidden")
+
+        violations, stats = validate_library(str(lib_dir))
+
+        assert [Path(v.file_path).parent.name for v in violations] == ["mylib_ext"]
+
+    def test_duplicate_locations_reported_once(self, temp_codebase):
+        """Test that one statement importing the same name twice gives one violation."""
+        lib_dir = temp_codebase / "mylib"
+        (lib_dir / "a").mkdir(parents=True)
+        (lib_dir / "b").mkdir()
+        (lib_dir / "__init__.py").write_text("")
+
+        (temp_codebase / "app.py").write_text("import mylib.a.helper, mylib.b.helper\n")
+
+        violations, _ = validate_library(str(lib_dir))
+
+        assert [(v.func_name, v.line_num) for v in violations] == [("helper", 1)]
+
+    def test_exclude_patterns(self, temp_codebase):
+        """Test that import locations matching any exclude pattern are skipped."""
+        lib_dir = temp_codebase / "mylib"
+        lib_dir.mkdir()
+        (lib_dir / "__init__.py").write_text("")
+        (lib_dir / "core.py").write_text("def _hidden(): pass")
+
+        for dir_name in ["tests", "build", "src"]:
+            (temp_codebase / dir_name).mkdir()
+            (temp_codebase / dir_name / "app.py").write_text("from mylib.core import _hidden")
+
+        violations, stats = validate_library(str(lib_dir), exclude_patterns=["*/tests/*", "*/build/*"])
+
+        assert [Path(v.file_path).parent.name for v in violations] == ["src"]
+
 
 class TestValidateLibraries:
     """Test validating multiple libraries."""
@@ -148,6 +195,70 @@ from lib2.core import _secret
         violations, stats = validate_libraries([str(lib1_dir), str(lib2_dir)])
         assert len(violations) == 2
 
+    def test_validate_libraries_keeps_input_order(self, temp_codebase):
+        """Test that libraries scanned together are reported in input order."""
+        lib_names = ["liba", "libb", "libc"]
+        for lib_name in lib_names:
+            lib_dir = temp_codebase / lib_name
+            lib_dir.mkdir()
+            (lib_dir / "__init__.py").write_text("")
+            (lib_dir / "core.py").write_text("def _hidden(): pass")
+
+        (temp_codebase / "app.py").write_text("".join(f"from {name}.core import _hidden\n" for name in lib_names))
+
+        violations, stats = validate_libraries([str(temp_codebase / name) for name in lib_names])
+
+        assert [lib["lib_name"] for lib in stats["libraries"]] == lib_names
+        assert [v.lib_name for v in violations] == lib_names
+        assert stats["total_violations"] == 3
+
+    def test_libraries_under_different_parents_keep_input_order(self, temp_codebase, monkeypatch):
+        """Test that libraries from several parents are validated in-process and reported in input order."""
+        lib_dirs = [temp_codebase / "a" / "liba", temp_codebase / "b" / "libb", temp_codebase / "a" / "libc"]
+        for lib_dir in lib_dirs:
+            lib_dir.mkdir(parents=True)
+            (lib_dir / "__init__.py").write_text("")
+            (lib_dir / "core.py").write_text("def _hidden(): pass")
+            (lib_dir.parent / f"use_{lib_dir.name}.py").write_text(f"from {lib_dir.name}.core import _hidden\n")
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("small runs must not start a process pool")
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+
+        violations, stats = validate_libraries([str(lib_dir) for lib_dir in lib_dirs])
+
+        assert [lib["lib_name"] for lib in stats["libraries"]] == ["liba", "libb", "libc"]
+        assert [(v.lib_name, Path(v.file_path).name) for v in violations] == [
+            ("liba", "use_liba.py"),
+            ("libb", "use_libb.py"),
+            ("libc", "use_libc.py"),
+        ]
+
+    def test_libraries_under_one_parent_scan_once(self, temp_codebase, monkeypatch):
+        """Test that libraries sharing a parent directory are scanned together."""
+        for lib_name in ["liba", "libb"]:
+            lib_dir = temp_codebase / lib_name
+            lib_dir.mkdir()
+            (lib_dir / "__init__.py").write_text("")
+            (lib_dir / "core.py").write_text("def _hidden(): pass")
+        (temp_codebase / "app.py").write_text("from liba.core import _hidden\nfrom libb.core import _hidden\n")
+
+        scans = []
+        real_find = validator.find_imports_for_libraries
+
+        def counting_find(lib_roots, *args, **kwargs):
+            scans.append([lib_root.name for lib_root in lib_roots])
+            return real_find(lib_roots, *args, **kwargs)
+
+        monkeypatch.setattr(validator, "find_imports_for_libraries", counting_find)
+
+        violations, stats = validate_libraries([str(temp_codebase / "liba"), str(temp_codebase / "libb")])
+
+        assert scans == [["liba", "libb"]]
+        assert [v.lib_name for v in violations] == ["liba", "libb"]
+        assert [lib["imports_count"] for lib in stats["libraries"]] == [1, 1]
+
 
 class TestViolation:
     """Test Violation class."""
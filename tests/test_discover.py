@@ -4,11 +4,24 @@ import json
 import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 # Add root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from pre_commit_tools.config import PreCommitConfig
 from pre_commit_tools.discover import (
+    DOCKER_BIT,
+    GO_BIT,
+    JAVASCRIPT_BIT,
+    JSON_FILE_BIT,
+    JSX_BIT,
+    PYTHON_BIT,
+    TOML_FILE_BIT,
+    TYPESCRIPT_BIT,
+    UV_LOCK_BIT,
+    XML_FILE_BIT,
+    YAML_FILE_BIT,
     detect_docker,
     detect_github_actions,
     detect_go,
@@ -23,6 +36,7 @@ from pre_commit_tools.discover import (
     detect_yaml_files,
     discover_config,
     discover_files,
+    extract_package_name,
 )
 
 
@@ -53,6 +67,27 @@ def test_discover_files():
         assert ".go" in files
 
 
+def test_discover_files_prunes_ignored_directories(tmp_path):
+    """Test that gitignored directories are not descended into."""
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+    (tmp_path / "app.py").write_text("")
+    (tmp_path / "debug.log").write_text("")
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    (build_dir / "bundle.js").write_text("")
+    node_dir = tmp_path / "web" / "node_modules" / "pkg"
+    node_dir.mkdir(parents=True)
+    (node_dir / "index.ts").write_text("")
+
+    files = discover_files(tmp_path)
+
+    assert "app.py" in files
+    assert "debug.log" not in files
+    assert "bundle.js" not in files
+    assert ".js" not in files
+    assert ".ts" not in files
+
+
 def test_detect_python():
     """Test Python project detection."""
     # Test with Python files
@@ -158,6 +193,16 @@ def test_detect_github_actions():
         tmp_path2.mkdir()
         assert not detect_github_actions(files, tmp_path2)
 
+        # Workflows directory with only non-workflow entries
+        other_workflows = tmp_path2 / ".github" / "workflows"
+        other_workflows.mkdir(parents=True)
+        (other_workflows / "README.md").write_text("docs")
+        (other_workflows / "nested.yml").mkdir()
+        assert not detect_github_actions(files, tmp_path2)
+
+        (other_workflows / "release.yaml").write_text("name: Release")
+        assert detect_github_actions(files, tmp_path2)
+
 
 def test_detect_file_types():
     """Test various file type detection functions."""
@@ -364,6 +409,22 @@ types-PyYAML
         assert dependencies == expected
 
 
+def test_detect_project_dependencies_requirements_options_and_markers(tmp_path):
+    """Test that options, indented comments, extras, markers and URLs are handled."""
+    (tmp_path / "requirements.txt").write_text(
+        "-r base.txt\n"
+        "--index-url https://example.com/simple\n"
+        "  # indented comment\n"
+        "   \n"
+        "  flask[async] ; python_version > '3.8'\n"
+        "mylib @ https://example.com/mylib.tar.gz\r\n"
+        "rich # trailing comment\n"
+        "attrs"
+    )
+
+    assert detect_project_dependencies(tmp_path) == {"flask", "mylib", "rich", "attrs"}
+
+
 def test_detect_project_dependencies_no_files():
     """Test dependency detection with no dependency files."""
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -371,3 +432,108 @@ def test_detect_project_dependencies_no_files():
 
         dependencies = detect_project_dependencies(tmp_path)
         assert dependencies == set()
+
+
+def test_extract_package_name():
+    """Test stripping extras, version specifiers and markers from requirements."""
+    assert extract_package_name("requests>=2.25.0") == "requests"
+    assert extract_package_name("PyYAML==6.0.2") == "PyYAML"
+    assert extract_package_name("setuptools~=61.0") == "setuptools"
+    assert extract_package_name("requests[security]>=2.0") == "requests"
+    assert extract_package_name("django!=4.0") == "django"
+    assert extract_package_name("tomli ; python_version<'3.11'") == "tomli"
+    assert extract_package_name("types-requests") == "types-requests"
+    assert extract_package_name("  pytest >= 8  ") == "pytest"
+    assert extract_package_name("mypkg @ https://example.com/mypkg.whl") == "mypkg"
+    assert extract_package_name("requests  # pinned by ops") == "requests"
+
+
+def test_scan_project_matches_detectors(tmp_path):
+    """Test that the single-pass project scan agrees with the individual detectors."""
+    from pre_commit_tools import discover
+
+    samples = [
+        ["setup.py", "uv.lock", "pyproject.toml"],
+        ["package.json", "App.tsx", "tsconfig.json"],
+        ["go.mod", "main.go", "Dockerfile", "ci.yml", "pom.xml"],
+        ["README.md"],
+    ]
+    detectors = [
+        (PYTHON_BIT, detect_python),
+        (UV_LOCK_BIT, detect_uv_lock),
+        (JAVASCRIPT_BIT, detect_javascript),
+        (TYPESCRIPT_BIT, detect_typescript),
+        (JSX_BIT, detect_jsx),
+        (GO_BIT, detect_go),
+        (DOCKER_BIT, detect_docker),
+        (YAML_FILE_BIT, detect_yaml_files),
+        (JSON_FILE_BIT, detect_json_files),
+        (TOML_FILE_BIT, detect_toml_files),
+        (XML_FILE_BIT, lambda files: ".xml" in files),
+    ]
+
+    for index, names in enumerate(samples):
+        project = tmp_path / str(index)
+        project.mkdir()
+        for name in names:
+            (project / name).write_text("")
+
+        mask = discover._scan_project(project)
+        files = discover_files(project)
+        for bit, detector in detectors:
+            assert bool(mask & bit) == detector(files)
+
+
+def test_discover_config_matches_validated_model(tmp_path):
+    """Test that the unvalidated discovery config equals a fully validated one."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nrequires-python = ">=3.12"\n')
+    (tmp_path / "app.py").write_text("")
+    (tmp_path / ".prettierrc").write_text("{}")
+    (tmp_path / "package.json").write_text("{}")
+
+    config = discover_config(tmp_path)
+    validated = PreCommitConfig.model_validate(config.model_dump(by_alias=True))
+
+    assert config == validated
+    assert config.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+
+
+def test_discover_config_stops_walking_once_everything_is_found(tmp_path):
+    """Test that the streaming scan stops as soon as every category is detected."""
+    from pre_commit_tools import discover
+
+    # Every indicator lives in the root directory
+    for name in discover.INDICATOR_BITS:
+        (tmp_path / name).write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    sub_dir = tmp_path / "src"
+    sub_dir.mkdir()
+    (sub_dir / "never_walked.txt").write_text("")
+
+    walked = []
+    real_walk = discover._walk_project
+
+    def tracking_walk(path):
+        for entry in real_walk(path):
+            walked.append(entry.name)
+            yield entry
+
+    with patch("pre_commit_tools.discover._walk_project", tracking_walk):
+        mask = discover._scan_project(tmp_path)
+
+    assert mask == discover.ALL_INDICATOR_BITS
+    assert "never_walked.txt" not in walked
+
+
+def test_discover_config_skips_version_probe_without_version_files(tmp_path):
+    """Test that the Python version is only probed when a version file is in the root."""
+    (tmp_path / "app.py").write_text("")
+
+    with patch("pre_commit_tools.discover.detect_python_version") as mock_detect:
+        config = discover_config(tmp_path)
+
+    mock_detect.assert_not_called()
+    assert config.python_version is None
+
+    (tmp_path / ".python-version").write_text("3.12\n")
+    assert discover_config(tmp_path).python_version == "python3.12"
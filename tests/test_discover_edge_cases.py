@@ -1,6 +1,7 @@
 """Tests for untested edge cases in discover.py module."""
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -43,6 +44,23 @@ class TestGitignoreLogic:
             patterns = read_gitignore_patterns(tmp_path)
             assert patterns == set()
 
+    def test_read_gitignore_patterns_picks_up_changes(self, tmp_path):
+        """Test that cached patterns are refreshed when .gitignore changes."""
+        gitignore_file = tmp_path / ".gitignore"
+        gitignore_file.write_text("*.pyc\n")
+        assert read_gitignore_patterns(tmp_path) == {"*.pyc"}
+
+        gitignore_file.write_text("*.log\n")
+        os.utime(gitignore_file, ns=(0, gitignore_file.stat().st_mtime_ns + 1_000_000))
+        assert read_gitignore_patterns(tmp_path) == {"*.log"}
+
+    def test_read_gitignore_patterns_returns_copy(self, tmp_path):
+        """Test that callers can mutate the returned set without affecting the cache."""
+        (tmp_path / ".gitignore").write_text("*.pyc\n")
+
+        read_gitignore_patterns(tmp_path).add(".git/")
+        assert read_gitignore_patterns(tmp_path) == {"*.pyc"}
+
     def test_is_ignored_by_gitignore_directory_patterns(self, tmp_path):
         """Test gitignore directory pattern matching."""
         patterns = {"__pycache__/", "node_modules/", ".git/"}
@@ -70,6 +88,28 @@ class TestGitignoreLogic:
         assert is_ignored_by_gitignore(file3, tmp_path, patterns) is True
         assert is_ignored_by_gitignore(file4, tmp_path, patterns) is False
 
+    def test_is_ignored_by_gitignore_literal_and_glob_directory_patterns(self, tmp_path):
+        """Test that literal directory patterns match exactly alongside glob directory patterns."""
+        patterns = {"build/", "docs/_build/", "cache-*/"}
+
+        assert is_ignored_by_gitignore(tmp_path / "build", tmp_path, patterns) is True
+        assert is_ignored_by_gitignore(tmp_path / "docs" / "_build", tmp_path, patterns) is True
+        assert is_ignored_by_gitignore(tmp_path / "cache-v1", tmp_path, patterns) is True
+        assert is_ignored_by_gitignore(tmp_path / "builder", tmp_path, patterns) is False
+        assert is_ignored_by_gitignore(tmp_path / "docs", tmp_path, patterns) is False
+
+    def test_is_ignored_by_gitignore_mixed_suffix_and_glob_patterns(self, tmp_path):
+        """Test that literal suffix patterns and glob patterns combine correctly."""
+        patterns = {"*.log", "*.py[co]", "*", "!keep"}
+
+        assert is_ignored_by_gitignore(tmp_path / "logs" / "app.log", tmp_path, patterns) is True
+        assert is_ignored_by_gitignore(tmp_path / "module.pyo", tmp_path, patterns) is True
+
+        patterns = {"*.log", "*.py[co]"}
+        assert is_ignored_by_gitignore(tmp_path / "module.pyc", tmp_path, patterns) is True
+        assert is_ignored_by_gitignore(tmp_path / "app.log.txt", tmp_path, patterns) is False
+        assert is_ignored_by_gitignore(tmp_path / "module.py", tmp_path, patterns) is False
+
     def test_is_ignored_by_gitignore_hardcoded_patterns(self, tmp_path):
         """Test hardcoded directory exclusions."""
         patterns = set()
@@ -83,6 +123,14 @@ class TestGitignoreLogic:
         assert is_ignored_by_gitignore(git_file, tmp_path, patterns) is True
         assert is_ignored_by_gitignore(node_file, tmp_path, patterns) is True
 
+    def test_is_ignored_by_gitignore_frozenset_patterns(self, tmp_path):
+        """Test that a frozenset of patterns is accepted and gives the same results."""
+        patterns = frozenset({"*.log", "build/"})
+
+        assert is_ignored_by_gitignore(tmp_path / "app.log", tmp_path, patterns) is True
+        assert is_ignored_by_gitignore(tmp_path / "build", tmp_path, patterns) is True
+        assert is_ignored_by_gitignore(tmp_path / "app.py", tmp_path, patterns) is False
+
     def test_is_ignored_by_gitignore_outside_project_root(self, tmp_path):
         """Test file outside project root returns False."""
         patterns = {"*.pyc"}
@@ -134,6 +182,41 @@ dependencies = ["requests"]
         version = detect_python_version(tmp_path)
         assert version is None
 
+    def test_detect_python_version_prefers_python_version_file(self, tmp_path):
+        """Test that .python-version wins over pyproject.toml without parsing it."""
+        (tmp_path / ".python-version").write_text("3.12\n")
+        (tmp_path / "pyproject.toml").write_text('[project]\nrequires-python = ">=3.9"\n')
+
+        with patch("pre_commit_tools.discover._load_pyproject") as mock_load:
+            version = detect_python_version(tmp_path)
+
+        assert version == "python3.12"
+        mock_load.assert_not_called()
+
+    def test_detect_python_version_requires_python_with_upper_bound(self, tmp_path):
+        """Test requires-python specifiers with spaces and an upper bound."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nrequires-python = ">= 3.10, <4"\n')
+
+        version = detect_python_version(tmp_path)
+        assert version == "python3.10"
+
+    def test_detect_python_version_uses_preparsed_pyproject(self, tmp_path):
+        """Test that pre-parsed pyproject data is used instead of reading the file."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nrequires-python = ">=3.9"\n')
+
+        version = detect_python_version(tmp_path, {"project": {"requires-python": ">=3.12"}})
+        assert version == "python3.12"
+
+    def test_detect_python_version_picks_up_pyproject_changes(self, tmp_path):
+        """Test that the cached pyproject.toml is re-parsed when the file changes."""
+        pyproject_file = tmp_path / "pyproject.toml"
+        pyproject_file.write_text('[project]\nrequires-python = ">=3.9"\n')
+        assert detect_python_version(tmp_path) == "python3.9"
+
+        pyproject_file.write_text('[project]\nrequires-python = ">=3.12"\n')
+        os.utime(pyproject_file, ns=(0, pyproject_file.stat().st_mtime_ns + 1_000_000))
+        assert detect_python_version(tmp_path) == "python3.12"
+
     def test_detect_python_version_missing_tomllib(self, tmp_path):
         """Test Python version detection when tomllib import fails."""
         pyproject_content = """
@@ -162,8 +245,7 @@ class TestConfigFileDiscovery:
         (tmp_path / ".prettierrc").write_text("{}")
         (tmp_path / "package.json").write_text("{}")
 
-        files = {"file1.py", ".prettierrc", "package.json"}
-        config_files = find_config_files(tmp_path, files)
+        config_files = find_config_files(tmp_path)
 
         assert config_files["prettier_config"] == ".prettierrc"
 
@@ -171,8 +253,7 @@ class TestConfigFileDiscovery:
         """Test finding ESLint configuration files."""
         (tmp_path / ".eslintrc.json").write_text("{}")
 
-        files = {"app.js", ".eslintrc.json"}
-        config_files = find_config_files(tmp_path, files)
+        config_files = find_config_files(tmp_path)
 
         assert config_files["eslint_config"] == ".eslintrc.json"
 
@@ -182,20 +263,41 @@ class TestConfigFileDiscovery:
         (tmp_path / ".prettierrc").write_text("{}")
         (tmp_path / ".prettierrc.json").write_text("{}")
 
-        files = {".prettierrc", ".prettierrc.json"}
-        config_files = find_config_files(tmp_path, files)
+        config_files = find_config_files(tmp_path)
 
         # Should pick the first one in the list
         assert config_files["prettier_config"] == ".prettierrc"
 
     def test_find_config_files_none_found(self, tmp_path):
         """Test config file discovery when no configs exist."""
-        files = {"app.py", "README.md"}
-        config_files = find_config_files(tmp_path, files)
+        (tmp_path / "app.py").write_text("")
+
+        config_files = find_config_files(tmp_path)
 
         assert "prettier_config" not in config_files
         assert "eslint_config" not in config_files
 
+    def test_find_config_files_ignores_subdirectories(self, tmp_path):
+        """Test that only root-level configs are used, since hooks get root-relative paths."""
+        sub_dir = tmp_path / "frontend"
+        sub_dir.mkdir()
+        (sub_dir / ".eslintrc.js").write_text("")
+        (tmp_path / ".prettierrc.yml").mkdir()
+
+        config_files = find_config_files(tmp_path)
+
+        assert config_files == {}
+
+    def test_find_config_files_priority_skips_directories(self, tmp_path):
+        """Test that a directory named like a preferred config does not win over a file."""
+        (tmp_path / ".eslintrc").mkdir()
+        (tmp_path / "eslint.config.js").write_text("")
+        (tmp_path / ".eslintrc.yaml").write_text("")
+
+        config_files = find_config_files(tmp_path)
+
+        assert config_files == {"eslint_config": ".eslintrc.yaml"}
+
 
 class TestDiscoverMainCLI:
     """Test the main CLI function."""
@@ -60,3 +60,13 @@ def test_generate_workflow_skip_no_commit_branch():
     workflow = generate_workflow()
 
     assert "SKIP: no-commit-to-branch" in workflow
+
+
+def test_generate_workflow_with_invalid_config(tmp_path):
+    """Test that an unparsable pre-commit config falls back to the default Python version."""
+    config_file = tmp_path / ".pre-commit-config.yaml"
+    config_file.write_text("repos: [unclosed\n")
+
+    workflow = generate_workflow(config_path=config_file)
+
+    assert "python-version: '3.11'" in workflow
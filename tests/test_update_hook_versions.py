@@ -0,0 +1,79 @@
+"""Tests for the hook version updater script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "update_hook_versions.py"
+
+
+@pytest.fixture(scope="module")
+def update_hook_versions():
+    """Load the updater script as a module."""
+    spec = importlib.util.spec_from_file_location("update_hook_versions", SCRIPT_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def template_repo(tmp_path):
+    """Create a repository root with a small set of hook templates."""
+    template_dir = tmp_path / "pre_commit_tools" / "hook_templates"
+    template_dir.mkdir(parents=True)
+    (template_dir / "meta.j2").write_text("repos:\n{{ content }}\n")
+    (template_dir / "base.j2").write_text(
+        "- repo: https://github.com/example/shared\n"
+        "  rev: v1.0.0\n"
+        "  hooks:\n"
+        "  - id: shared\n"
+        "- repo: https://github.com/example/other\n"
+        "  rev: v1.0.0\n"
+        "  hooks:\n"
+        "  - id: other\n"
+    )
+    (template_dir / "docker.j2").write_text(
+        "- repo: https://github.com/example/shared\n  rev: v1.0.0\n  hooks:\n  - id: shared-docker\n"
+    )
+    return tmp_path
+
+
+UPDATED_HOOKS = [{"repo": "https://github.com/example/shared", "old_rev": "v1.0.0", "new_rev": "v2.0.0"}]
+
+
+def test_apply_updates_to_templates(update_hook_versions, template_repo):
+    """Test that only the updated repository is bumped, in every template that uses it."""
+    updater = update_hook_versions.TemplateUpdater(template_repo)
+    updater.extract_original_revisions()
+    updater.updated_hooks = UPDATED_HOOKS
+
+    updates_per_file = updater.apply_updates_to_templates()
+
+    template_dir = updater.template_dir
+    assert updates_per_file == {"base.j2": 1, "docker.j2": 1}
+    # The other repository shares the old revision but was not updated
+    assert (template_dir / "base.j2").read_text() == (
+        "- repo: https://github.com/example/shared\n"
+        "  rev: v2.0.0\n"
+        "  hooks:\n"
+        "  - id: shared\n"
+        "- repo: https://github.com/example/other\n"
+        "  rev: v1.0.0\n"
+        "  hooks:\n"
+        "  - id: other\n"
+    )
+    assert "rev: v2.0.0" in (template_dir / "docker.j2").read_text()
+    assert (template_dir / "meta.j2").read_text() == "repos:\n{{ content }}\n"
+
+
+def test_apply_updates_without_extraction(update_hook_versions, template_repo):
+    """Test that updates are applied from disk when revisions were not extracted first."""
+    updater = update_hook_versions.TemplateUpdater(template_repo)
+    updater.updated_hooks = UPDATED_HOOKS
+
+    updates_per_file = updater.apply_updates_to_templates()
+
+    assert updates_per_file == {"base.j2": 1, "docker.j2": 1}
+    assert "https://github.com/example/other\n  rev: v1.0.0" in (updater.template_dir / "base.j2").read_text()